@@ -0,0 +1,182 @@
+"""
+ACERO INDUSTRIAL - Backtesting de Guardrails
+"¿Qué habría pasado si...?": re-procesa un extracto historico de
+transacciones con las reglas actuales y compara el margen realizado contra
+el contrafactual, junto con el share de aprobaciones y el drift.
+
+Politica simulada por deal:
+- Riesgo (risk_score_batch) en el top `approval_share` -> pasa a aprobacion
+  humana y conserva su precio historico.
+- Resto: descuento limitado al techo del tier y precio nunca bajo el piso de
+  margen.
+- La erosion quote -> invoice se reduce en `drift_reduction`.
+El margen se mide sobre deals ganados (outcome == 'Won').
+
+Todo corre en un solo proceso: el trabajo pesado (guardrails y riesgo) es
+vectorizado y el umbral de riesgo es un cuantil global, asi que repartir
+segmentos entre procesos solo agregaba el costo de copiar los arreglos.
+
+Uso:
+    python backtest.py transacciones.csv
+"""
+
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+from pricing import guardrails_batch, risk_score_batch
+
+TRANSACTION_COLUMNS = [
+    'segment', 'tier', 'category', 'region', 'quantity',
+    'list_price', 'quoted_price', 'unit_price', 'total_cost', 'outcome'
+]
+# Se leen si estan: con product_id aplican tambien los quiebres por SKU
+OPTIONAL_COLUMNS = ['product_id']
+
+# Sumas parciales por segmento; los KPIs se derivan al final
+_SUMS = [
+    'deals', 'approvals', 'won',
+    'quote_revenue', 'invoice_revenue', 'cost',
+    'cf_quote_revenue', 'cf_invoice_revenue'
+]
+
+
+def read_transactions(path, columns=TRANSACTION_COLUMNS, optional=OPTIONAL_COLUMNS):
+    transactions = pd.read_csv(path, usecols=lambda c: c in columns or c in optional, dtype={'product_id': str})
+    missing = set(columns) - set(transactions.columns)
+    if missing:
+        raise ValueError(f"Faltan columnas en {path}: {', '.join(sorted(missing))}")
+    if transactions.empty:
+        raise ValueError(f"Sin transacciones en {path}")
+    return transactions
+
+
+def counterfactual_prices(arrays, risk_threshold, drift_reduction):
+    """Precio cotizado e invoice contrafactual por deal (elemento a elemento)."""
+    list_price = arrays['list_price']
+    quoted = arrays['quoted_price']
+    unit_cost = arrays['total_cost'] / arrays['quantity']
+
+    approved = arrays['risk'] >= risk_threshold
+
+    # Precio contrafactual: descuento capado al techo y precio >= piso de margen
+    discount = (1 - quoted / list_price) * 100
+    capped = list_price * (1 - np.minimum(discount, arrays['ceiling_discount']) / 100)
+    floor_price = unit_cost / (1 - arrays['margin_floor'] / 100)
+    cf_quoted = np.where(approved, quoted, np.maximum(capped, floor_price))
+
+    drift = arrays['unit_price'] / quoted - 1
+    cf_invoiced = cf_quoted * (1 + drift * (1 - drift_reduction))
+    return approved, cf_quoted, cf_invoiced
+
+
+def _replay_segment(arrays, risk_threshold, drift_reduction):
+    approved, cf_quoted, cf_invoiced = counterfactual_prices(arrays, risk_threshold, drift_reduction)
+
+    won = arrays['won']
+    q = arrays['quantity'][won]
+    return {
+        'deals': len(approved),
+        'approvals': int(approved.sum()),
+        'won': int(won.sum()),
+        'quote_revenue': float(arrays['quoted_price'][won] @ q),
+        'invoice_revenue': float(arrays['unit_price'][won] @ q),
+        'cost': float(arrays['total_cost'][won].sum()),
+        'cf_quote_revenue': float(cf_quoted[won] @ q),
+        'cf_invoice_revenue': float(cf_invoiced[won] @ q)
+    }
+
+
+def _summarize(sums):
+    sums = pd.DataFrame(sums).T[_SUMS].astype(float)
+    sums.loc['Total'] = sums.sum()
+    return pd.DataFrame({
+        'deals': sums['deals'].astype(int),
+        'gm_quote': (1 - sums['cost'] / sums['quote_revenue']) * 100,
+        'gm_invoice': (1 - sums['cost'] / sums['invoice_revenue']) * 100,
+        'cf_gm_quote': (1 - sums['cost'] / sums['cf_quote_revenue']) * 100,
+        'cf_gm_invoice': (1 - sums['cost'] / sums['cf_invoice_revenue']) * 100,
+        'approval_share': sums['approvals'] / sums['deals'] * 100,
+        'drift': (sums['invoice_revenue'] / sums['quote_revenue'] - 1) * 100,
+        'cf_drift': (sums['cf_invoice_revenue'] / sums['cf_quote_revenue'] - 1) * 100
+    })
+
+
+def prepare_transactions(transactions):
+    """Agrega guardrails y score de riesgo por fila (vectorizado)."""
+    guidance = guardrails_batch(
+        transactions['tier'], transactions['category'],
+        transactions['segment'], transactions['region'],
+        quantities=transactions['quantity'],
+        product_ids=transactions['product_id'] if 'product_id' in transactions else None
+    )
+    list_price = transactions['list_price'].to_numpy(dtype=float)
+    quoted = transactions['quoted_price'].to_numpy(dtype=float)
+    unit_cost = transactions['total_cost'].to_numpy(dtype=float) / transactions['quantity'].to_numpy(dtype=float)
+
+    discount = (1 - quoted / list_price) * 100
+    margin = (quoted - unit_cost) / quoted * 100
+
+    return {
+        'segment': transactions['segment'].to_numpy(),
+        'list_price': list_price,
+        'quoted_price': quoted,
+        'unit_price': transactions['unit_price'].to_numpy(dtype=float),
+        'quantity': transactions['quantity'].to_numpy(dtype=float),
+        'total_cost': transactions['total_cost'].to_numpy(dtype=float),
+        'won': (transactions['outcome'] == 'Won').to_numpy(),
+        'ceiling_discount': guidance['ceiling_discount'].to_numpy(),
+        'margin_floor': guidance['margin_floor'].to_numpy(),
+        'risk': risk_score_batch(discount, margin, guidance)
+    }
+
+
+def split_by_segment(prepared):
+    segments, codes = np.unique(prepared['segment'], return_inverse=True)
+    order = np.argsort(codes, kind='stable')
+    bounds = np.searchsorted(codes[order], np.arange(len(segments) + 1))
+    columns = [k for k in prepared if k != 'segment']
+    return {
+        segment: {k: prepared[k][order[bounds[i]:bounds[i + 1]]] for k in columns}
+        for i, segment in enumerate(segments)
+    }
+
+
+def replay(prepared, risk_threshold, drift_reduction=0.7):
+    parts = split_by_segment(prepared)
+    sums = {s: _replay_segment(a, risk_threshold, drift_reduction) for s, a in parts.items()}
+    return _summarize(sums)
+
+
+def run_backtest(transactions, approval_share=0.05, drift_reduction=0.7):
+    """Backtest completo: un KPI por segmento mas la fila 'Total'."""
+    if transactions.empty:
+        raise ValueError("El extracto no tiene transacciones")
+    prepared = prepare_transactions(transactions)
+    risk_threshold = np.quantile(prepared['risk'], 1 - approval_share)
+    return replay(prepared, risk_threshold, drift_reduction)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backtest de guardrails sobre un extracto historico.")
+    parser.add_argument('input', help="CSV de transacciones historicas")
+    parser.add_argument('--approval-share', type=float, default=0.05, help="Fraccion de deals a aprobacion (default: 0.05)")
+    parser.add_argument('--drift-reduction', type=float, default=0.7, help="Reduccion de erosion simulada (default: 0.7)")
+    args = parser.parse_args(argv)
+
+    try:
+        report = run_backtest(
+            read_transactions(args.input),
+            approval_share=args.approval_share,
+            drift_reduction=args.drift_reduction
+        )
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"error: {exc}\n")
+    print(report.round(2).to_string())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+ACERO INDUSTRIAL - Catalogo Columnar de Productos y Clientes
+Carga el maestro de productos / clientes desde CSV o Parquet a un store
+columnar indexado por posicion (un .npy por columna, categoricas como codigos
+enteros) que se abre con memory-map: los procesos workers comparten las mismas
+paginas sin copiar y abrir el catalogo completo toma milisegundos.
+
+El store se reconstruye solo cuando cambia el archivo fuente (tamaño / mtime).
+
+Uso:
+    python catalog.py maestro_productos.parquet --key product_id --categorical category
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = Path(os.environ.get('ACERO_DATA_DIR', Path(__file__).resolve().parent / 'data'))
+
+PRODUCT_COLUMNS = {'key': 'product_id', 'categorical': ('category',)}
+CUSTOMER_COLUMNS = {'key': 'customer_id', 'categorical': ('segment', 'tier', 'region')}
+
+
+class Catalog(Mapping):
+    # Mapping id -> registro (dict), compatible con los antiguos dicts
+    # PRODUCTS / CUSTOMERS; los procesos batch usan directamente las columnas.
+
+    def __init__(self, key, columns, labels):
+        self.key = key
+        self.columns = columns
+        self.labels = labels
+        self.ids = columns[key]
+        self._fields = [name for name in columns if name != key]
+        self._positions = None
+        self._index = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        return iter(self.ids.tolist())
+
+    def __getitem__(self, item_id):
+        return self.record(self.position(item_id))
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = pd.Index(self.ids.tolist())
+        return self._index
+
+    def position(self, item_id):
+        if self._positions is None:
+            self._positions = {k: i for i, k in enumerate(self.ids.tolist())}
+        return self._positions[item_id]
+
+    def locate(self, ids, kind='Codigo'):
+        """Posiciones de un arreglo de ids; KeyError si alguno no existe."""
+        positions = self.index.get_indexer(np.asarray(ids, dtype=object))
+        if (positions < 0).any():
+            missing = pd.unique(np.asarray(ids, dtype=object)[positions < 0])
+            raise KeyError(f"{kind} desconocido(s): {', '.join(map(str, missing[:5]))}")
+        return positions
+
+    def codes(self, name):
+        return self.columns[name]
+
+    def values(self, name):
+        if name in self.labels:
+            return np.asarray(self.labels[name], dtype=object)[self.columns[name]]
+        return np.asarray(self.columns[name])
+
+    def record(self, position):
+        record = {}
+        for name in self._fields:
+            value = self.columns[name][position]
+            record[name] = self.labels[name][value] if name in self.labels else value.item()
+        return record
+
+    def to_frame(self):
+        return pd.DataFrame({name: self.values(name) for name in self.columns})
+
+
+def read_source(source):
+    source = Path(source)
+    if source.suffix == '.parquet':
+        return pd.read_parquet(source)
+    return pd.read_csv(source, dtype={'product_id': str, 'customer_id': str})
+
+
+def encode_frame(frame, key, categorical=()):
+    """Convierte un DataFrame a columnas NumPy (texto de ancho fijo, codigos o float)."""
+    if frame[key].isna().any() or frame[key].duplicated().any():
+        raise ValueError(f"La llave '{key}' tiene nulos o duplicados")
+
+    columns, labels = {}, {}
+    for name in frame.columns:
+        series = frame[name]
+        if name in categorical:
+            if series.isna().any():
+                raise ValueError(f"Nulos en columna categorica '{name}'")
+            codes, uniques = pd.factorize(series)
+            columns[name] = codes.astype(np.int32)
+            labels[name] = tuple(str(v) for v in uniques)
+        elif name != key and pd.api.types.is_numeric_dtype(series):
+            columns[name] = series.to_numpy(dtype=float)
+        else:
+            columns[name] = series.fillna('').astype(str).to_numpy(dtype=str)
+    return columns, labels
+
+
+def _signature(source):
+    stat = Path(source).stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def save_store(store, key, columns, labels, signature=None):
+    store = Path(store)
+    store.mkdir(parents=True, exist_ok=True)
+    suffix = f'.{os.getpid()}.tmp'
+    for name, array in columns.items():
+        tmp = store / f'{name}.npy{suffix}'
+        with open(tmp, 'wb') as f:
+            np.save(f, array)
+        os.replace(tmp, store / f'{name}.npy')
+
+    # meta.json va al final: un store sin meta (o con otra firma) se reconstruye
+    meta = {'key': key, 'columns': list(columns), 'labels': labels, 'source': signature}
+    tmp = store / f'meta.json{suffix}'
+    tmp.write_text(json.dumps(meta, ensure_ascii=False), encoding='utf-8')
+    os.replace(tmp, store / 'meta.json')
+
+
+def _read_meta(store):
+    return json.loads((Path(store) / 'meta.json').read_text(encoding='utf-8'))
+
+
+def open_store(store, mmap_mode='r'):
+    store = Path(store)
+    meta = _read_meta(store)
+    columns = {name: np.load(store / f'{name}.npy', mmap_mode=mmap_mode) for name in meta['columns']}
+    labels = {name: tuple(values) for name, values in meta['labels'].items()}
+    return Catalog(meta['key'], columns, labels)
+
+
+def load_catalog(source, key, categorical=(), store=None):
+    """Abre el store memory-mapped de `source`, reconstruyendolo si esta desactualizado."""
+    source = Path(source)
+    store = Path(store) if store is not None else source.parent / '.store' / source.stem
+    if not source.exists():
+        try:
+            return open_store(store)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No existe {source} ni un store compilado en {store}") from None
+
+    signature = _signature(source)
+    try:
+        if _read_meta(store)['source'] == signature:
+            return open_store(store)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    columns, labels = encode_frame(read_source(source), key, categorical)
+    try:
+        save_store(store, key, columns, labels, signature)
+    except OSError:
+        # Directorio de solo lectura: se usa el catalogo en memoria sin persistir
+        return Catalog(key, columns, labels)
+    return open_store(store)
+
+
+def load_products(source=None, store=None):
+    return load_catalog(source or DATA_DIR / 'products.csv', store=store, **PRODUCT_COLUMNS)
+
+
+def load_customers(source=None, store=None):
+    return load_catalog(source or DATA_DIR / 'customers.csv', store=store, **CUSTOMER_COLUMNS)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compila un maestro CSV/Parquet a un store columnar memory-mapped.")
+    parser.add_argument('source', help="CSV o Parquet del maestro")
+    parser.add_argument('--key', required=True, help="Columna llave (p.ej. product_id)")
+    parser.add_argument('--categorical', nargs='*', default=(), help="Columnas a codificar como enteros")
+    parser.add_argument('--store', default=None, help="Directorio del store (default: data/.store/<nombre>)")
+    args = parser.parse_args(argv)
+
+    try:
+        start = time.perf_counter()
+        catalog = load_catalog(args.source, args.key, tuple(args.categorical), args.store)
+        elapsed = time.perf_counter() - start
+    except (OSError, KeyError, ValueError) as exc:
+        parser.exit(1, f"error: {exc}\n")
+
+    print(f"{len(catalog):,} registros, {len(catalog.columns)} columnas ({elapsed * 1000:.1f} ms)", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
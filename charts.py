@@ -0,0 +1,152 @@
+"""
+ACERO INDUSTRIAL - Graficos de la Presentacion
+Tema oscuro compartido y constructores de figuras Plotly.
+
+Los graficos se construyen una vez por proceso (st.cache_resource) y se
+comparten entre sesiones; Streamlit solo los serializa en cada rerun. El
+template "acero_dark" reemplaza al template por defecto de Plotly, que agrega
+~6 KB a cada figura enviada al navegador. Fondo, fuentes y grilla van como
+valores del layout: st.plotly_chart (theme="streamlit") mezcla su propio tema
+sobre layout.template y los pisaria.
+
+El motor de precios se importa recien al construir el grafico de
+elasticidad, asi que las slides estaticas no cargan catalogo ni reglas.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+from plotly.subplots import make_subplots
+
+from catalog import DATA_DIR
+from rules import RuleSnapshot
+
+# =============================================================================
+# TEMA
+# =============================================================================
+
+DARK_TEMPLATE = go.layout.Template(
+    layout=dict(colorway=['#10b981', '#3b82f6', '#f59e0b', '#ef4444', '#8b5cf6'])
+)
+pio.templates['acero_dark'] = DARK_TEMPLATE
+
+DARK_LAYOUT = dict(
+    template='acero_dark',
+    plot_bgcolor='rgba(30, 41, 59, 0.6)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    font=dict(color='#cbd5e1', family='Space Mono'),
+    legend=dict(font=dict(color='#cbd5e1'))
+)
+TITLE_FONT = dict(size=16, color='#10b981', family='Crimson Pro')
+GRID_COLOR = '#334155'
+
+
+def apply_dark_theme(fig):
+    fig.update_layout(**DARK_LAYOUT)
+    fig.update_xaxes(gridcolor=GRID_COLOR)
+    fig.update_yaxes(gridcolor=GRID_COLOR)
+    return fig
+
+# =============================================================================
+# SLIDE 2: INCONSISTENCIA
+# =============================================================================
+
+# Cifras del diagnostico inicial; se reemplazan por la salida de
+# `python inconsistency.py <extracto> --output data/inconsistency.csv`
+INCONSISTENCY_DATA = pd.DataFrame({
+    'Métrica': ['Rango Precio > 5%', 'Std Descuento > 2pp', 'Margen Negativo', 'Descuento > 25%'],
+    'Porcentaje': [71.74, 76.81, 0.48, 0.44]
+})
+INCONSISTENCY_PATH = DATA_DIR / 'inconsistency.csv'
+
+
+def build_inconsistency_figure(data):
+    fig = go.Figure(go.Bar(
+        x=data['Porcentaje'],
+        y=data['Métrica'],
+        orientation='h',
+        marker_color=['#ef4444', '#ef4444', '#f59e0b', '#f59e0b'],
+        text=[f"{p:.1f}%" for p in data['Porcentaje']],
+        textposition='inside',
+        textfont=dict(size=14, color='white')
+    ))
+
+    apply_dark_theme(fig)
+    fig.update_layout(
+        title=dict(text='Inconsistencia en Pares Cliente-Producto', font=TITLE_FONT),
+        xaxis_title='% de Pares',
+        xaxis_range=[0, 100],
+        height=300
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _inconsistency_figure(modified):
+    data = pd.read_csv(INCONSISTENCY_PATH) if modified is not None else INCONSISTENCY_DATA
+    return build_inconsistency_figure(data)
+
+
+def inconsistency_figure():
+    # Se reconstruye solo cuando se regenera el CSV del analizador
+    path = Path(INCONSISTENCY_PATH)
+    return _inconsistency_figure(path.stat().st_mtime_ns if path.exists() else None)
+
+# =============================================================================
+# SLIDE 8: ELASTICIDAD
+# =============================================================================
+
+def build_elasticity_figure(guidance, scenarios):
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+
+    fig.add_trace(
+        go.Scatter(
+            x=scenarios['discount'],
+            y=scenarios['expected_margin'],
+            fill='tozeroy',
+            fillcolor='rgba(16, 185, 129, 0.3)',
+            line=dict(color='#10b981', width=3),
+            name='Margen Esperado'
+        ),
+        secondary_y=False
+    )
+
+    fig.add_trace(
+        go.Scatter(
+            x=scenarios['discount'],
+            y=scenarios['win_prob'],
+            line=dict(color='#3b82f6', width=2, dash='dash'),
+            name='Prob. de Ganar (%)'
+        ),
+        secondary_y=True
+    )
+
+    fig.add_vline(x=guidance['target_discount'], line_dash="solid", line_color="#10b981",
+                  annotation_text="Target", annotation_position="top")
+    fig.add_vline(x=guidance['ceiling_discount'], line_dash="dash", line_color="#f59e0b",
+                  annotation_text="Techo", annotation_position="top")
+
+    apply_dark_theme(fig)
+    fig.update_layout(
+        title=dict(text='Analisis de Elasticidad: Descuento vs Margen Esperado', font=dict(TITLE_FONT, size=18)),
+        xaxis_title='Descuento (%)',
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1),
+        height=350
+    )
+
+    fig.update_yaxes(title_text="Margen Esperado ($)", secondary_y=False)
+    fig.update_yaxes(title_text="Prob. Ganar (%)", secondary_y=True)
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=256, hash_funcs={RuleSnapshot: lambda rules: rules.version})
+def elasticity_figure(customer_id, product_id, quantity, rules):
+    # Por (cliente, producto, cantidad, version de reglas); compartida entre
+    # sesiones sin copiar. La figura se arma con el mismo snapshot que la llave.
+    from pricing import calculate_price_guidance, simulate_scenarios
+
+    guidance = calculate_price_guidance(customer_id, product_id, quantity, rules)
+    return build_elasticity_figure(guidance, simulate_scenarios(guidance, quantity))
@@ -0,0 +1,173 @@
+"""
+ACERO INDUSTRIAL - Cubo de Cobertura (Zonas Thin)
+Conteo incremental de transacciones por celda para decidir donde hace falta
+pooling: % de celdas con 30+ y 50+ transacciones (slide 3) siempre al dia
+con los datos vivos.
+
+Las celdas se guardan en un dict disperso con llave entera (codigos por
+dimension empaquetados en un uint64), asi que tambien sirve para cruces
+grandes como cliente x producto. Cada fila cuesta O(1) y los contadores por
+umbral se actualizan cuando una celda cruza el umbral, de modo que
+"celdas con N+ transacciones" se responde sin recorrer el cubo.
+
+Uso:
+    python coverage.py transacciones.csv --dimensions product_id segment
+"""
+
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Misma jerarquia que pooling.HIERARCHY; se repite para no cargar el motor
+# de precios (catalogo y reglas) desde este CLI
+CELL_DIMENSIONS = ('segment', 'tier', 'category', 'region')
+PRODUCT_SEGMENT = ('product_id', 'segment')
+CUSTOMER_PRODUCT = ('customer_id', 'product_id')
+
+THRESHOLDS = (30, 50)
+
+
+class CoverageCube:
+
+    def __init__(self, dimensions=CELL_DIMENSIONS, thresholds=THRESHOLDS):
+        self.dimensions = tuple(dimensions)
+        self.thresholds = tuple(sorted(thresholds))
+        self.bits = 64 // len(self.dimensions)
+
+        self.labels = {d: [] for d in self.dimensions}
+        self._codes = {d: {} for d in self.dimensions}
+        self.counts = {}
+        self.reached = dict.fromkeys(self.thresholds, 0)
+        self.rows = 0
+
+    def _encode(self, dimension, value):
+        codes = self._codes[dimension]
+        code = codes.get(value)
+        if code is None:
+            code = len(codes)
+            if code >> self.bits:
+                raise ValueError(f"Demasiados niveles en '{dimension}' (max {2 ** self.bits})")
+            codes[value] = code
+            self.labels[dimension].append(value)
+        return code
+
+    def _encode_many(self, dimension, values):
+        codes = pd.Index(self.labels[dimension]).get_indexer(values)
+        unseen = codes < 0
+        if unseen.any():
+            for value in pd.unique(values[unseen]):
+                self._encode(dimension, value)
+            codes[unseen] = pd.Index(self.labels[dimension]).get_indexer(values[unseen])
+        return codes
+
+    def key(self, *values):
+        key = 0
+        for dimension, value in zip(self.dimensions, values):
+            key = (key << self.bits) | self._encode(dimension, value)
+        return key
+
+    def decode(self, key):
+        mask = (1 << self.bits) - 1
+        codes = []
+        for _ in self.dimensions:
+            codes.append(key & mask)
+            key >>= self.bits
+        return tuple(self.labels[d][c] for d, c in zip(self.dimensions, reversed(codes)))
+
+    def _increment(self, key, n):
+        old = self.counts.get(key, 0)
+        new = old + n
+        self.counts[key] = new
+        for threshold in self.thresholds:
+            if old < threshold <= new:
+                self.reached[threshold] += 1
+
+    def add(self, *values, n=1):
+        """Suma `n` transacciones a la celda de `values` (en el orden de dimensions)."""
+        self._increment(self.key(*values), n)
+        self.rows += n
+
+    def update(self, transactions):
+        """Suma un lote (DataFrame con las columnas de dimensions)."""
+        keys = np.zeros(len(transactions), dtype=np.uint64)
+        for dimension in self.dimensions:
+            codes = self._encode_many(dimension, transactions[dimension].to_numpy(dtype=object))
+            keys = (keys << np.uint64(self.bits)) | codes.astype(np.uint64)
+
+        unique, counts = np.unique(keys, return_counts=True)
+        for key, n in zip(unique.tolist(), counts.tolist()):
+            self._increment(key, n)
+        self.rows += len(transactions)
+        return self
+
+    def merge(self, other):
+        for key, n in other.counts.items():
+            self.add(*other.decode(key), n=n)
+        return self
+
+    def count(self, *values):
+        key = 0
+        for dimension, value in zip(self.dimensions, values):
+            code = self._codes[dimension].get(value)
+            if code is None:
+                return 0
+            key = (key << self.bits) | code
+        return self.counts.get(key, 0)
+
+    @property
+    def cells(self):
+        return len(self.counts)
+
+    def cells_at_least(self, threshold):
+        if threshold in self.reached:
+            return self.reached[threshold]
+        return sum(1 for n in self.counts.values() if n >= threshold)
+
+    def coverage(self):
+        """% de celdas observadas que alcanzan cada umbral."""
+        cells = self.cells
+        return pd.DataFrame({
+            'umbral': [f"{t}+" for t in self.thresholds],
+            'celdas': [self.reached[t] for t in self.thresholds],
+            'pct_celdas': [self.reached[t] / cells * 100 if cells else 0.0 for t in self.thresholds]
+        })
+
+    def thin_cells(self, threshold=None):
+        """Celdas bajo `threshold` (default: el mayor umbral): candidatas a pooling."""
+        threshold = self.thresholds[-1] if threshold is None else threshold
+        thin = [(*self.decode(key), n) for key, n in self.counts.items() if n < threshold]
+        return pd.DataFrame(thin, columns=[*self.dimensions, 'n']).sort_values('n', ignore_index=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cobertura de transacciones por celda (zonas thin).")
+    parser.add_argument('input', help="CSV de transacciones")
+    parser.add_argument('--dimensions', nargs='+', default=list(CELL_DIMENSIONS), help="Columnas que definen la celda")
+    parser.add_argument('--thresholds', nargs='+', type=int, default=list(THRESHOLDS))
+    parser.add_argument('--chunk-size', type=int, default=500_000, help="Filas por bloque (default: 500000)")
+    args = parser.parse_args(argv)
+
+    cube = CoverageCube(args.dimensions, args.thresholds)
+    try:
+        missing = set(args.dimensions) - set(pd.read_csv(args.input, nrows=0).columns)
+        if missing:
+            raise ValueError(f"Faltan columnas en {args.input}: {', '.join(sorted(missing))}")
+        reader = pd.read_csv(args.input, usecols=args.dimensions, dtype=str, chunksize=args.chunk_size)
+        for chunk in reader:
+            cube.update(chunk)
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"error: {exc}\n")
+
+    print(f"{cube.rows:,} transacciones en {cube.cells:,} celdas", file=sys.stderr)
+    print(cube.coverage().round(2).to_string(index=False))
+    thin = cube.thin_cells()
+    if len(thin):
+        print(f"\nCeldas bajo {cube.thresholds[-1]} transacciones:")
+        print(thin.head(20).to_string(index=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""
+ACERO INDUSTRIAL - Monitor de Drift Quote-to-Invoice
+Procesa pares quoted_price / unit_price como stream y mantiene, por cliente,
+producto y vendedor:
+- media y varianza acumuladas del drift (Welford);
+- una ventana deslizante por buckets de tiempo (ring buffer) con suma,
+  conteo y deals con |drift| > 1%.
+
+Cada evento cuesta O(1) y nunca se re-escanea el historico. Cuando la media de
+la ventana o el share de |drift| > 1% cruzan su umbral se emite una alerta
+(una sola vez por cruce; se rearma al volver a rango).
+
+Por defecto los umbrales son relativos a la linea base del diagnostico: una
+llave alerta cuando su ventana queda `z_crit` errores estandar peor que la
+linea base (el umbral se estrecha a medida que la ventana junta deals), asi
+que el drift ya conocido no dispara alertas por si solo. Con
+`mean_threshold` / `breach_share_threshold` se fijan umbrales absolutos.
+"""
+
+from collections import namedtuple
+
+import pandas as pd
+
+DIMENSIONS = ('customer_id', 'product_id', 'rep_id')
+
+# Linea base del diagnostico: drift medio -3.87% y 87.78% de deals con |drift| > 1%
+BASELINE_MEAN = -3.87
+BASELINE_BREACH_SHARE = 0.8778
+
+DriftAlert = namedtuple('DriftAlert', ['dimension', 'key', 'metric', 'value', 'threshold', 'timestamp'])
+
+
+class DriftStats:
+    __slots__ = (
+        'count', 'mean', 'm2',
+        'bucket_sum', 'bucket_count', 'bucket_breach', 'head',
+        'window_sum', 'window_count', 'window_breach', 'alerting'
+    )
+
+    def __init__(self, n_buckets):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.bucket_sum = [0.0] * n_buckets
+        self.bucket_count = [0] * n_buckets
+        self.bucket_breach = [0] * n_buckets
+        self.head = None
+        self.window_sum = 0.0
+        self.window_count = 0
+        self.window_breach = 0
+        self.alerting = set()
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def window_mean(self):
+        return self.window_sum / self.window_count if self.window_count else 0.0
+
+    @property
+    def window_breach_share(self):
+        return self.window_breach / self.window_count if self.window_count else 0.0
+
+    def _advance(self, bucket):
+        # Limpia los buckets que salen de la ventana (a lo sumo n_buckets)
+        n = len(self.bucket_sum)
+        if self.head is None:
+            self.head = bucket
+            return
+        for b in range(self.head + 1, min(bucket, self.head + n) + 1):
+            slot = b % n
+            self.window_sum -= self.bucket_sum[slot]
+            self.window_count -= self.bucket_count[slot]
+            self.window_breach -= self.bucket_breach[slot]
+            self.bucket_sum[slot] = 0.0
+            self.bucket_count[slot] = 0
+            self.bucket_breach[slot] = 0
+        self.head = bucket
+
+    def add(self, drift, bucket, breach):
+        self.count += 1
+        delta = drift - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (drift - self.mean)
+
+        if self.head is None or bucket > self.head:
+            self._advance(bucket)
+        elif bucket <= self.head - len(self.bucket_sum):
+            # Evento mas viejo que la ventana: solo cuenta en el acumulado
+            return
+
+        slot = bucket % len(self.bucket_sum)
+        self.bucket_sum[slot] += drift
+        self.bucket_count[slot] += 1
+        self.bucket_breach[slot] += breach
+        self.window_sum += drift
+        self.window_count += 1
+        self.window_breach += breach
+
+
+class DriftMonitor:
+    # drift = (unit_price / quoted_price - 1) x 100; negativo = erosion.
+
+    def __init__(self, bucket_seconds=86400, n_buckets=30, mean_threshold=None,
+                 breach_share_threshold=None, breach_pct=1.0, min_count=20, on_alert=None,
+                 baseline_mean=BASELINE_MEAN, baseline_breach_share=BASELINE_BREACH_SHARE, z_crit=4.0):
+        self.bucket_seconds = bucket_seconds
+        self.n_buckets = n_buckets
+        self.mean_threshold = mean_threshold
+        self.breach_share_threshold = breach_share_threshold
+        self.breach_pct = breach_pct
+        self.min_count = min_count
+        self.on_alert = on_alert
+        self.baseline_mean = baseline_mean
+        self.baseline_breach_share = baseline_breach_share
+        self.z_crit = z_crit
+        self.stats = {dimension: {} for dimension in DIMENSIONS}
+
+    def ingest(self, quoted_price, unit_price, timestamp, customer_id=None, product_id=None, rep_id=None):
+        """Procesa un evento; devuelve las alertas que dispara (normalmente ninguna)."""
+        if hasattr(timestamp, 'timestamp'):
+            timestamp = timestamp.timestamp()
+        drift = (unit_price / quoted_price - 1) * 100
+        bucket = int(timestamp // self.bucket_seconds)
+        breach = int(abs(drift) > self.breach_pct)
+
+        alerts = []
+        for dimension, key in zip(DIMENSIONS, (customer_id, product_id, rep_id)):
+            if key is None:
+                continue
+            stats = self.stats[dimension].get(key)
+            if stats is None:
+                stats = self.stats[dimension][key] = DriftStats(self.n_buckets)
+            stats.add(drift, bucket, breach)
+            if stats.window_count >= self.min_count:
+                alerts += self._check(dimension, key, stats, timestamp)
+
+        if self.on_alert is not None:
+            for alert in alerts:
+                self.on_alert(alert)
+        return alerts
+
+    def thresholds(self, stats):
+        """Umbrales (media, share) vigentes para la ventana de una llave."""
+        n = stats.window_count
+        mean_threshold = self.mean_threshold
+        if mean_threshold is None:
+            mean_threshold = self.baseline_mean - self.z_crit * (stats.variance / n) ** 0.5
+        share_threshold = self.breach_share_threshold
+        if share_threshold is None:
+            p = self.baseline_breach_share
+            share_threshold = p + self.z_crit * (p * (1 - p) / n) ** 0.5
+        return mean_threshold, share_threshold
+
+    def _check(self, dimension, key, stats, timestamp):
+        alerts = []
+        mean_threshold, share_threshold = self.thresholds(stats)
+        checks = (
+            ('window_mean', stats.window_mean, mean_threshold, stats.window_mean < mean_threshold),
+            ('breach_share', stats.window_breach_share, share_threshold,
+             stats.window_breach_share > share_threshold)
+        )
+        for metric, value, threshold, breached in checks:
+            if breached and metric not in stats.alerting:
+                stats.alerting.add(metric)
+                alerts.append(DriftAlert(dimension, key, metric, value, threshold, timestamp))
+            elif not breached:
+                stats.alerting.discard(metric)
+        return alerts
+
+    def ingest_frame(self, events):
+        """Procesa un DataFrame ordenado por tiempo (columna 'date' o 'timestamp')."""
+        time_column = 'timestamp' if 'timestamp' in events.columns else 'date'
+        seconds = events[time_column].astype('datetime64[s]').astype('int64').tolist()
+        values = [events[c].tolist() if c in events.columns else [None] * len(events) for c in DIMENSIONS]
+
+        alerts = []
+        for quoted, invoiced, ts, customer, product, rep in zip(
+            events['quoted_price'].tolist(), events['unit_price'].tolist(), seconds, *values
+        ):
+            alerts += self.ingest(quoted, invoiced, ts, customer, product, rep)
+        return alerts
+
+    def snapshot(self, dimension):
+        """Estado actual por llave de una dimension, como DataFrame."""
+        rows = {
+            key: {
+                'count': s.count,
+                'mean': s.mean,
+                'std': s.variance ** 0.5,
+                'window_count': s.window_count,
+                'window_mean': s.window_mean,
+                'window_breach_share': s.window_breach_share,
+                'alerting': ', '.join(sorted(s.alerting))
+            }
+            for key, s in self.stats[dimension].items()
+        }
+        return pd.DataFrame.from_dict(rows, orient='index')
@@ -0,0 +1,108 @@
+"""
+ACERO INDUSTRIAL - Evaluador de Cotizaciones por Lotes (CLI)
+Procesa un extracto CSV de cotizaciones en bloques de tamaño fijo con la
+guia de precios y el evaluador de guardrails, escribiendo los resultados de
+forma incremental (memoria constante sin importar el tamaño del archivo).
+Los decimales se redondean (default 4) y cada bloque se escribe con el
+writer CSV de pyarrow (llega con streamlit), ~10x mas rapido que to_csv.
+
+Uso:
+    python evaluate_quotes.py cotizaciones.csv resultados.csv --chunk-size 100000
+
+Columnas requeridas: customer_id, product_id, quantity, quoted_price
+"""
+
+import argparse
+import sys
+import time
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+from pricing import (
+    calculate_price_guidance_batch,
+    decode_status,
+    evaluate_quote_batch,
+)
+
+INPUT_COLUMNS = ['customer_id', 'product_id', 'quantity', 'quoted_price']
+GUIDANCE_COLUMNS = [
+    'target_discount', 'ceiling_discount', 'hard_max_discount', 'margin_floor',
+    'target_price', 'ceiling_price', 'floor_price'
+]
+
+
+def evaluate_chunk(chunk):
+    guidance = calculate_price_guidance_batch(chunk)
+    evaluation = evaluate_quote_batch(chunk['quoted_price'], guidance)
+
+    result = chunk.reset_index(drop=True)
+    for column in GUIDANCE_COLUMNS:
+        result[column] = guidance[column].to_numpy()
+    result['discount'] = evaluation['discount']
+    result['margin'] = evaluation['margin']
+    result['status_code'] = evaluation['status']
+    result['status'] = decode_status(evaluation['status'])
+    return result
+
+
+def write_chunk(result, out, header, decimals=4):
+    result = result.round(decimals)
+    if pa is None:
+        result.to_csv(out, header=header, index=False)
+        return
+    if header:
+        out.write((','.join(result.columns) + '\n').encode())
+    table = pa.Table.from_pandas(result, preserve_index=False)
+    pa_csv.write_csv(table, out, pa_csv.WriteOptions(include_header=False, quoting_style='needed'))
+
+
+def evaluate_file(input_path, output_path, chunk_size=100_000, decimals=4):
+    reader = pd.read_csv(
+        input_path,
+        chunksize=chunk_size,
+        dtype={'customer_id': str, 'product_id': str}
+    )
+
+    rows = 0
+    with open(output_path, 'wb') as out:
+        for chunk in reader:
+            missing = set(INPUT_COLUMNS) - set(chunk.columns)
+            if missing:
+                raise ValueError(f"Faltan columnas en {input_path}: {', '.join(sorted(missing))}")
+            try:
+                result = evaluate_chunk(chunk)
+            except KeyError as exc:
+                raise ValueError(f"Filas {rows + 1}-{rows + len(chunk)}: {exc.args[0]}") from exc
+            write_chunk(result, out, rows == 0, decimals)
+            rows += len(chunk)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evalua un extracto CSV de cotizaciones contra los guardrails.")
+    parser.add_argument('input', help="CSV de cotizaciones")
+    parser.add_argument('output', help="CSV de resultados")
+    parser.add_argument('--chunk-size', type=int, default=100_000, help="Filas por bloque (default: 100000)")
+    parser.add_argument('--decimals', type=int, default=4, help="Decimales en la salida (default: 4)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        rows = evaluate_file(args.input, args.output, args.chunk_size, args.decimals)
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"error: {exc}\n")
+    elapsed = time.perf_counter() - start
+
+    rate = rows / elapsed if elapsed > 0 else float('inf')
+    print(f"{rows:,} filas en {elapsed:.2f}s ({rate:,.0f} filas/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
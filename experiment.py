@@ -0,0 +1,192 @@
+"""
+ACERO INDUSTRIAL - Champion / Challenger
+Capa de experimentacion sobre calculate_price_guidance / evaluate_quote:
+
+- Asignacion por hash estable de la unidad (cliente por defecto): el mismo
+  cliente cae siempre en el mismo brazo, en cualquier proceso, sin tabla.
+  Con challenger_share=0.2, ~20% de los clientes van al Challenger; la
+  proporcion de cotizaciones es 2 de cada 10 solo en promedio, porque cada
+  cliente aporta su propio volumen.
+- Acumuladores online por brazo: win rate sobre deals Won/Lost, margen
+  facturado (invoice GM %) y drift quote -> invoice de deals ganados.
+- Kill switch secuencial: en cada outcome se compara challenger vs champion
+  por metrica; si el challenger queda peor que el champion por mas de la
+  tolerancia con z < -z_crit, se apaga y todas las cotizaciones siguientes
+  van al champion. z_crit = 3 es una frontera constante conservadora para
+  mirar los datos despues de cada deal. El error estandar se agrupa por
+  unidad: los deals de un mismo cliente estan correlacionados y no cuentan
+  como observaciones independientes.
+"""
+
+import hashlib
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from pricing import calculate_price_guidance, evaluate_quote
+
+CHAMPION = 'champion'
+CHALLENGER = 'challenger'
+ARMS = (CHAMPION, CHALLENGER)
+
+# metrica -> tolerancia (pp) antes de considerar al challenger peor
+KILL_TOLERANCES = {
+    'win_rate': 2.0,
+    'gm_invoice': 1.0,
+    'drift': 1.0
+}
+
+KillEvent = namedtuple('KillEvent', ['metric', 'challenger', 'champion', 'z', 'deals'])
+
+
+def assign_arm(unit_key, challenger_share=0.2, salt='champion-challenger'):
+    """Brazo de una unidad por hash estable (blake2b), uniforme en [0, 1)."""
+    digest = hashlib.blake2b(f"{salt}:{unit_key}".encode(), digest_size=8).digest()
+    return CHALLENGER if int.from_bytes(digest, 'big') / 2 ** 64 < challenger_share else CHAMPION
+
+
+class ClusteredStat:
+    # Media por deal con varianza agrupada por unidad (estimador de razon):
+    # se guardan n y suma por unidad y las sumas de cuadrados entre unidades,
+    # que se corrigen en O(1) cuando una unidad recibe un deal nuevo.
+    __slots__ = ('units', 'count', 'total', 'syy', 'syn', 'snn')
+
+    def __init__(self):
+        self.units = {}
+        self.count = 0
+        self.total = 0.0
+        self.syy = 0.0
+        self.syn = 0.0
+        self.snn = 0.0
+
+    def add(self, unit_key, value):
+        n, y = self.units.get(unit_key, (0, 0.0))
+        self.syy -= y * y
+        self.syn -= y * n
+        self.snn -= n * n
+        n, y = n + 1, y + value
+        self.syy += y * y
+        self.syn += y * n
+        self.snn += n * n
+        self.units[unit_key] = (n, y)
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def mean_variance(self):
+        """Varianza de la media, robusta a la correlacion dentro de cada unidad."""
+        k = len(self.units)
+        if k < 2:
+            return 0.0
+        r = self.mean
+        residual = self.syy - 2 * r * self.syn + r * r * self.snn
+        return k / (k - 1) * max(residual, 0.0) / self.count ** 2
+
+
+class ArmStats:
+    __slots__ = ('quotes', 'win_rate', 'gm_invoice', 'drift', 'revenue', 'cost', 'quote_revenue')
+
+    def __init__(self):
+        self.quotes = 0
+        self.win_rate = ClusteredStat()
+        self.gm_invoice = ClusteredStat()
+        self.drift = ClusteredStat()
+        self.revenue = 0.0
+        self.cost = 0.0
+        self.quote_revenue = 0.0
+
+
+class Experiment:
+
+    def __init__(self, challenger_share=0.2, unit='customer_id', salt='champion-challenger',
+                 z_crit=3.0, min_deals=100, min_units=20, tolerances=None, on_kill=None):
+        self.challenger_share = challenger_share
+        self.unit = unit
+        self.salt = salt
+        self.z_crit = z_crit
+        self.min_deals = min_deals
+        self.min_units = min_units
+        self.tolerances = dict(KILL_TOLERANCES if tolerances is None else tolerances)
+        self.on_kill = on_kill
+        self.stats = {arm: ArmStats() for arm in ARMS}
+        self.killed = None
+
+    @property
+    def active(self):
+        return self.killed is None
+
+    def arm(self, unit_key):
+        return assign_arm(unit_key, self.challenger_share, self.salt)
+
+    def quote(self, customer_id, product_id, quantity, quoted_price=None):
+        """Cotizacion bajo el experimento: el challenger recibe guia y evaluacion."""
+        unit_key = customer_id if self.unit == 'customer_id' else product_id
+        arm = self.arm(unit_key)
+        self.stats[arm].quotes += 1
+
+        result = {'arm': arm, 'served': CHAMPION, 'guidance': None, 'evaluation': None}
+        if arm == CHALLENGER and self.active:
+            guidance = calculate_price_guidance(customer_id, product_id, quantity)
+            result['served'] = CHALLENGER
+            result['guidance'] = guidance
+            if quoted_price is not None:
+                result['evaluation'] = evaluate_quote(quoted_price, guidance)
+        return result
+
+    def record(self, unit_key, outcome, quoted_price, unit_price, unit_cost, quantity=1):
+        """Registra el resultado de un deal y evalua el kill switch.
+
+        Devuelve el KillEvent si este deal apago al challenger, si no None.
+        """
+        if outcome not in ('Won', 'Lost'):
+            return None
+        stats = self.stats[self.arm(unit_key)]
+        won = outcome == 'Won'
+        stats.win_rate.add(unit_key, 100.0 if won else 0.0)
+        if won:
+            stats.gm_invoice.add(unit_key, (unit_price - unit_cost) / unit_price * 100)
+            stats.drift.add(unit_key, (unit_price / quoted_price - 1) * 100)
+            stats.revenue += unit_price * quantity
+            stats.cost += unit_cost * quantity
+            stats.quote_revenue += quoted_price * quantity
+
+        if self.active:
+            return self._check()
+        return None
+
+    def _check(self):
+        champion, challenger = self.stats[CHAMPION], self.stats[CHALLENGER]
+        for metric, tolerance in self.tolerances.items():
+            a, b = getattr(challenger, metric), getattr(champion, metric)
+            if min(a.count, b.count) < self.min_deals or min(len(a.units), len(b.units)) < self.min_units:
+                continue
+            se = (a.mean_variance + b.mean_variance) ** 0.5
+            if se == 0:
+                continue
+            z = (a.mean - b.mean + tolerance) / se
+            if z < -self.z_crit:
+                self.killed = KillEvent(metric, a.mean, b.mean, z, challenger.win_rate.count)
+                if self.on_kill is not None:
+                    self.on_kill(self.killed)
+                return self.killed
+        return None
+
+    def summary(self):
+        """KPIs por brazo (GM y drift agregados por revenue)."""
+        rows = {}
+        for arm, s in self.stats.items():
+            rows[arm] = {
+                'quotes': s.quotes,
+                'decided': s.win_rate.count,
+                'win_rate': s.win_rate.mean,
+                'gm_invoice': (1 - s.cost / s.revenue) * 100 if s.revenue else np.nan,
+                'drift': (s.revenue / s.quote_revenue - 1) * 100 if s.quote_revenue else np.nan
+            }
+        table = pd.DataFrame.from_dict(rows, orient='index')
+        table['active'] = [True, self.active]
+        return table
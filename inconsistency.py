@@ -0,0 +1,161 @@
+"""
+ACERO INDUSTRIAL - Inconsistencia en Pares Cliente-Producto
+Calcula desde el extracto crudo las metricas del grafico de la slide 2:
+% de pares cliente-producto con rango de precio > 5%, std de descuento > 2pp,
+algun deal con margen negativo y algun deal con descuento > 25%.
+
+El archivo se procesa por bloques: cada bloque se reduce con un groupby a
+agregados parciales por par (conteo, min/max/suma de precio, media y M2 de
+descuento, conteos de excepciones) que se combinan entre si, asi que la
+memoria depende del numero de pares y no del tamaño del extracto.
+
+Solo cuentan los pares con al menos `min_deals` deals (default 2: con un
+solo deal no hay variabilidad que medir).
+
+Uso:
+    python inconsistency.py transacciones.csv --output data/inconsistency.csv
+"""
+
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+PAIR_KEYS = ['customer_id', 'product_id']
+INPUT_COLUMNS = PAIR_KEYS + ['unit_price', 'discount_pct', 'margin_dollars']
+
+METRIC_LABELS = {
+    'price_range': 'Rango Precio > 5%',
+    'discount_std': 'Std Descuento > 2pp',
+    'negative_margin': 'Margen Negativo',
+    'deep_discount': 'Descuento > 25%'
+}
+
+
+def pair_aggregates(chunk, price_column='unit_price', deep_discount_pct=25.0):
+    """Agregados parciales por (cliente, producto) de un bloque de transacciones."""
+    frame = pd.DataFrame({
+        'customer_id': chunk['customer_id'].to_numpy(),
+        'product_id': chunk['product_id'].to_numpy(),
+        'price': chunk[price_column].to_numpy(dtype=float),
+        'discount': chunk['discount_pct'].to_numpy(dtype=float),
+        'negative_margin': (chunk['margin_dollars'].to_numpy(dtype=float) < 0).astype(np.int64),
+        'deep_discount': (chunk['discount_pct'].to_numpy(dtype=float) > deep_discount_pct).astype(np.int64)
+    })
+    grouped = frame.groupby(PAIR_KEYS, sort=False)
+    aggregates = grouped.agg(
+        n=('price', 'size'),
+        price_min=('price', 'min'),
+        price_max=('price', 'max'),
+        price_sum=('price', 'sum'),
+        discount_mean=('discount', 'mean'),
+        negative_margin=('negative_margin', 'sum'),
+        deep_discount=('deep_discount', 'sum')
+    )
+    # M2 = n x varianza poblacional; se combina sin perder precision (Chan et al.)
+    aggregates['discount_m2'] = grouped['discount'].var(ddof=0) * aggregates['n']
+    return aggregates
+
+
+def merge_aggregates(*partials):
+    """Combina agregados parciales de bloques distintos (mismo formato)."""
+    stacked = pd.concat([p for p in partials if p is not None])
+    grouped = stacked.groupby(level=PAIR_KEYS, sort=False)
+
+    n = grouped['n'].transform('sum')
+    mean = (stacked['discount_mean'] * stacked['n']).groupby(level=PAIR_KEYS, sort=False).transform('sum') / n
+    stacked = stacked.assign(discount_m2=stacked['discount_m2'] + stacked['n'] * (stacked['discount_mean'] - mean) ** 2)
+    stacked['discount_mean'] = mean
+
+    grouped = stacked.groupby(level=PAIR_KEYS, sort=False)
+    return grouped.agg(
+        n=('n', 'sum'),
+        price_min=('price_min', 'min'),
+        price_max=('price_max', 'max'),
+        price_sum=('price_sum', 'sum'),
+        discount_mean=('discount_mean', 'first'),
+        negative_margin=('negative_margin', 'sum'),
+        deep_discount=('deep_discount', 'sum'),
+        discount_m2=('discount_m2', 'sum')
+    )
+
+
+def analyze_pairs(source, chunk_size=500_000, price_column='unit_price', deep_discount_pct=25.0):
+    """Agregados por par para un CSV (por bloques) o un DataFrame ya cargado."""
+    if isinstance(source, pd.DataFrame):
+        chunks = (source,)
+    else:
+        chunks = pd.read_csv(
+            source,
+            usecols=lambda c: c in INPUT_COLUMNS or c == price_column,
+            dtype={'customer_id': str, 'product_id': str},
+            chunksize=chunk_size
+        )
+
+    required = set(PAIR_KEYS) | {price_column, 'discount_pct', 'margin_dollars'}
+    aggregates = None
+    for chunk in chunks:
+        missing = required - set(chunk.columns)
+        if missing:
+            name = 'el DataFrame' if isinstance(source, pd.DataFrame) else source
+            raise ValueError(f"Faltan columnas en {name}: {', '.join(sorted(missing))}")
+        partial = pair_aggregates(chunk, price_column, deep_discount_pct)
+        aggregates = partial if aggregates is None else merge_aggregates(aggregates, partial)
+    if aggregates is None:
+        raise ValueError(f"Sin transacciones en {source}")
+    return aggregates
+
+
+def pair_metrics(aggregates, min_deals=2):
+    """Rango de precio (% de la media) y std de descuento (pp, muestral) por par."""
+    pairs = aggregates[aggregates['n'] >= min_deals]
+    mean_price = pairs['price_sum'] / pairs['n']
+    return pd.DataFrame({
+        'n': pairs['n'],
+        'price_range_pct': (pairs['price_max'] - pairs['price_min']) / mean_price * 100,
+        'discount_std': np.sqrt(pairs['discount_m2'] / (pairs['n'] - 1)),
+        'negative_margin': pairs['negative_margin'] > 0,
+        'deep_discount': pairs['deep_discount'] > 0
+    })
+
+
+def inconsistency_summary(aggregates, min_deals=2, price_range_pct=5.0, discount_std_pp=2.0):
+    """Tabla Métrica / Porcentaje (% de pares) en el formato del grafico de la slide 2."""
+    metrics = pair_metrics(aggregates, min_deals)
+    flags = {
+        'price_range': metrics['price_range_pct'] > price_range_pct,
+        'discount_std': metrics['discount_std'] > discount_std_pp,
+        'negative_margin': metrics['negative_margin'],
+        'deep_discount': metrics['deep_discount']
+    }
+    return pd.DataFrame({
+        'Métrica': [METRIC_LABELS[k] for k in flags],
+        'Porcentaje': [float(v.mean() * 100) if len(v) else 0.0 for v in flags.values()]
+    })
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Metricas de inconsistencia por par cliente-producto.")
+    parser.add_argument('input', help="CSV de transacciones historicas")
+    parser.add_argument('--output', default=None, help="CSV para el grafico (p.ej. data/inconsistency.csv)")
+    parser.add_argument('--chunk-size', type=int, default=500_000, help="Filas por bloque (default: 500000)")
+    parser.add_argument('--price-column', default='unit_price', help="Precio a comparar (default: unit_price)")
+    parser.add_argument('--min-deals', type=int, default=2, help="Deals minimos por par (default: 2)")
+    args = parser.parse_args(argv)
+
+    try:
+        aggregates = analyze_pairs(args.input, args.chunk_size, args.price_column)
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"error: {exc}\n")
+    summary = inconsistency_summary(aggregates, args.min_deals)
+
+    print(f"{int((aggregates['n'] >= args.min_deals).sum()):,} pares con {args.min_deals}+ deals", file=sys.stderr)
+    print(summary.round(2).to_string(index=False))
+    if args.output:
+        summary.to_csv(args.output, index=False)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+ACERO INDUSTRIAL - Optimizador de Profit Esperado
+Expected Profit = (p - c) x q x P(win | p), con p = list_price x (1 - d/100).
+
+La curva de win-prob es lineal por tramos, asi que dentro de cada tramo el
+profit esperado es cuadratico en el descuento: el optimo esta en un extremo
+del tramo o en el vertice de la parabola. En lugar de una grilla densa se
+evaluan solo esos candidatos (breakpoints, cortes con los limites de
+probabilidad, vertices y las cotas del deal), en lote para N deals.
+
+Restricciones por deal: 0 <= d <= hard_max del tier y margen >= margin_floor.
+"""
+
+import numpy as np
+import pandas as pd
+
+from pricing import (
+    WIN_CURVE_ANCHOR,
+    WIN_CURVE_BREAKS,
+    WIN_CURVE_SLOPE,
+    WIN_CURVE_START,
+    WIN_PROB_MAX,
+    WIN_PROB_MIN,
+    win_probability,
+)
+
+
+def _curve_candidates():
+    # Breakpoints y el float inmediatamente posterior: los tramos son
+    # (b_i, b_i+1], por lo que el supremo del tramo siguiente empieza justo
+    # despues del breakpoint.
+    points = [WIN_CURVE_BREAKS, np.nextafter(WIN_CURVE_BREAKS, np.inf)]
+
+    # Cortes de cada tramo con los limites de probabilidad (el clip crea
+    # nuevos breakpoints si la recta los cruza)
+    sloped = WIN_CURVE_SLOPE != 0
+    for bound in (WIN_PROB_MIN, WIN_PROB_MAX):
+        cross = WIN_CURVE_ANCHOR[sloped] + (bound - WIN_CURVE_START[sloped]) / WIN_CURVE_SLOPE[sloped]
+        points += [cross, np.nextafter(cross, np.inf)]
+    return np.concatenate(points)
+
+
+CURVE_CANDIDATES = _curve_candidates()
+
+
+def expected_profit(discount, list_price, cost, quantity):
+    price = list_price * (1 - discount / 100)
+    return (price - cost) * quantity * win_probability(discount)
+
+
+def optimize_discount_batch(guidance, quantities=None):
+    """Descuento que maximiza el profit esperado por deal.
+
+    `guidance` es el DataFrame de calculate_price_guidance_batch (list_price,
+    cost, quantity, margin_floor, hard_max_discount). Deals donde ni el precio
+    lista cumple el piso de margen quedan con feasible=False y descuento 0.
+    """
+    list_price = np.asarray(guidance['list_price'], dtype=float)[:, None]
+    cost = np.asarray(guidance['cost'], dtype=float)[:, None]
+    if quantities is None:
+        quantities = guidance['quantity']
+    quantity = np.asarray(quantities, dtype=float)[:, None]
+
+    floor_price = cost / (1 - np.asarray(guidance['margin_floor'], dtype=float)[:, None] / 100)
+    floor_discount = (1 - floor_price / list_price) * 100
+    max_discount = np.minimum(np.asarray(guidance['hard_max_discount'], dtype=float)[:, None], floor_discount)
+    feasible = max_discount[:, 0] >= 0
+    max_discount = np.maximum(max_discount, 0)
+
+    # Vertice de cada tramo: d* = (m a - b s) / (2 b m), con a = L - c,
+    # b = L / 100 y P = s + m d (solo tramos con pendiente)
+    sloped = WIN_CURVE_SLOPE != 0
+    m = WIN_CURVE_SLOPE[sloped]
+    s = WIN_CURVE_START[sloped] - WIN_CURVE_ANCHOR[sloped] * m
+    a = list_price - cost
+    b = list_price / 100
+    vertices = (m * a - b * s) / (2 * b * m)
+
+    candidates = np.concatenate([
+        np.zeros_like(max_discount),
+        max_discount,
+        np.broadcast_to(CURVE_CANDIDATES, (len(list_price), len(CURVE_CANDIDATES))),
+        vertices
+    ], axis=1)
+    candidates = np.clip(candidates, 0, max_discount)
+
+    profit = expected_profit(candidates, list_price, cost, quantity)
+    best = np.argmax(profit, axis=1)
+    rows = np.arange(len(best))
+    discount = np.where(feasible, candidates[rows, best], 0.0)
+
+    price = list_price[:, 0] * (1 - discount / 100)
+    return pd.DataFrame({
+        'optimal_discount': discount,
+        'optimal_price': price,
+        'win_prob': win_probability(discount) * 100,
+        'margin_pct': (price - cost[:, 0]) / price * 100,
+        'expected_margin': expected_profit(discount, list_price[:, 0], cost[:, 0], quantity[:, 0]),
+        'max_discount': max_discount[:, 0],
+        'feasible': feasible
+    }, index=getattr(guidance, 'index', None))
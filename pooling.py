@@ -0,0 +1,117 @@
+"""
+ACERO INDUSTRIAL - Pooling Jerarquico para Celdas Thin
+Estimador incremental por celda de la jerarquia
+segmento -> tier -> categoria -> region.
+
+Cada nivel guarda estadisticos suficientes (conteo, suma, suma de cuadrados)
+en arreglos densos; un lote nuevo de deals se acumula con bincount y el costo
+de actualizar no depende del tamaño del historico. El estimado de cada celda
+se encoge hacia el de su padre:
+
+    pooled = (n x media + k x pooled_padre) / (n + k)
+
+con k = `prior_strength` (pseudo-conteo). Celdas con muchas transacciones
+quedan casi en su media; celdas thin (p.ej. segmento "Other") heredan del
+nivel agregado.
+"""
+
+import numpy as np
+import pandas as pd
+
+from pricing import get_rule_cube
+
+HIERARCHY = ('segment', 'tier', 'category', 'region')
+
+
+class HierarchicalPool:
+
+    def __init__(self, value_column='discount_pct', prior_strength=30.0):
+        self.value_column = value_column
+        self.prior_strength = prior_strength
+
+        cube = get_rule_cube()
+        # Slot extra al final para niveles no configurados (salvo tier)
+        self.labels = {
+            'segment': cube.segments + ('(otro)',),
+            'tier': cube.tiers,
+            'category': cube.categories + ('(otro)',),
+            'region': cube.regions + ('(otro)',)
+        }
+        self._encoders = {
+            'segment': cube.encode_segment,
+            'tier': cube.encode_tier,
+            'category': cube.encode_category,
+            'region': cube.encode_region
+        }
+        self.shape = tuple(len(self.labels[d]) for d in HIERARCHY)
+
+        # Nivel 0 = global, nivel 4 = celda completa
+        self.count = [np.zeros(self.shape[:depth]) for depth in range(len(HIERARCHY) + 1)]
+        self.total = [np.zeros(self.shape[:depth]) for depth in range(len(HIERARCHY) + 1)]
+        self.total_sq = [np.zeros(self.shape[:depth]) for depth in range(len(HIERARCHY) + 1)]
+
+    def update(self, deals):
+        """Acumula un lote de deals (DataFrame con la jerarquia y value_column)."""
+        codes = [self._encoders[d](deals[d]) for d in HIERARCHY]
+        cells = np.ravel_multi_index(codes, self.shape)
+        values = deals[self.value_column].to_numpy(dtype=float)
+
+        size = int(np.prod(self.shape))
+        count = np.bincount(cells, minlength=size).reshape(self.shape)
+        total = np.bincount(cells, weights=values, minlength=size).reshape(self.shape)
+        total_sq = np.bincount(cells, weights=values * values, minlength=size).reshape(self.shape)
+
+        # Los niveles superiores se obtienen sumando ejes de la celda completa
+        for depth in range(len(HIERARCHY), -1, -1):
+            self.count[depth] += count
+            self.total[depth] += total
+            self.total_sq[depth] += total_sq
+            if depth:
+                count, total, total_sq = count.sum(axis=-1), total.sum(axis=-1), total_sq.sum(axis=-1)
+        return self
+
+    def merge(self, other):
+        for depth in range(len(HIERARCHY) + 1):
+            self.count[depth] += other.count[depth]
+            self.total[depth] += other.total[depth]
+            self.total_sq[depth] += other.total_sq[depth]
+        return self
+
+    def _mean(self, depth):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self.count[depth] > 0, self.total[depth] / self.count[depth], 0.0)
+
+    def pooled(self):
+        """Estimado encogido por nivel: lista de arreglos, del global a la celda."""
+        estimates = [self._mean(0)]
+        k = self.prior_strength
+        for depth in range(1, len(HIERARCHY) + 1):
+            parent = estimates[-1][..., None]
+            n = self.count[depth]
+            estimates.append((n * self._mean(depth) + k * parent) / (n + k))
+        return estimates
+
+    def summary(self, depth=len(HIERARCHY)):
+        """Tabla por celda del nivel `depth` (solo celdas con datos)."""
+        n = self.count[depth]
+        mean = self._mean(depth)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            var = np.where(n > 1, (self.total_sq[depth] - n * mean * mean) / (n - 1), np.nan)
+        pooled = self.pooled()[depth]
+
+        if depth:
+            index = pd.MultiIndex.from_product([self.labels[d] for d in HIERARCHY[:depth]], names=HIERARCHY[:depth])
+        else:
+            index = pd.Index(['Total'])
+        table = pd.DataFrame({
+            'n': n.ravel().astype(int),
+            'mean': mean.ravel(),
+            'std': np.sqrt(np.maximum(var, 0)).ravel(),
+            'pooled': pooled.ravel(),
+            'weight': (n / (n + self.prior_strength)).ravel()
+        }, index=index)
+        return table[table['n'] > 0]
+
+    def lookup(self, segment, tier, category, region):
+        codes = [self._encoders[d](v) for d, v in zip(HIERARCHY, (segment, tier, category, region))]
+        return self.pooled()[-1][tuple(codes)]
@@ -0,0 +1,426 @@
+"""
+ACERO INDUSTRIAL - Motor de Precios
+Reglas de guardrails (snapshots versionados), catálogo y funciones de cálculo
+compartidas por la app Streamlit y los procesos batch (sin dependencia de
+Streamlit). Las funciones aceptan `rules=` para fijar un snapshot durante un
+request o un proceso completo; por defecto usan el vigente.
+"""
+
+import numpy as np
+import pandas as pd
+
+from catalog import load_customers, load_products
+from rule_cube import RuleCube
+from rules import RuleStore
+
+# =============================================================================
+# DATOS Y CONFIGURACIÓN
+# =============================================================================
+
+# Reglas de guardrails: snapshots versionados de data/rules.json (ver rules.py)
+RULES = RuleStore()
+
+# Maestros de productos y clientes: store columnar memory-mapped (ver catalog.py)
+PRODUCTS = load_products()
+CUSTOMERS = load_customers()
+
+# Curva de probabilidad de ganar por descuento: tramos lineales anclados en
+# (WIN_CURVE_ANCHOR, WIN_CURVE_START) con pendiente WIN_CURVE_SLOPE.
+# Tramo i cubre (WIN_CURVE_BREAKS[i-1], WIN_CURVE_BREAKS[i]].
+WIN_CURVE_BREAKS = np.array([5.0, 10.0, 15.0, 20.0])
+WIN_CURVE_ANCHOR = np.array([0.0, 5.0, 10.0, 15.0, 20.0])
+WIN_CURVE_START = np.array([0.80, 0.80, 0.75, 0.54, 0.35])
+WIN_CURVE_SLOPE = np.array([0.0, -0.01, -0.04, -0.04, 0.01])
+WIN_PROB_MIN = 0.15
+WIN_PROB_MAX = 0.95
+
+DISCOUNT_GRID = np.arange(0, 30, 0.5)
+
+# Estados del evaluador de cotizaciones (codigos uint8 en modo batch).
+# RED se divide en dos codigos para conservar el mensaje de cada causa.
+STATUS_GREEN = 0
+STATUS_YELLOW = 1
+STATUS_ORANGE = 2
+STATUS_RED = 3
+STATUS_RED_MARGIN = 4
+
+STATUS_LABELS = ('GREEN', 'YELLOW', 'ORANGE', 'RED', 'RED')
+STATUS_MESSAGES = (
+    'Dentro del objetivo - Aprobación automática',
+    'Por encima del objetivo - Notificación a gerente',
+    'Por encima del techo - Requiere aprobación gerente',
+    'Excede máximo - Requiere aprobación VP',
+    'Violación de margen mínimo - Requiere aprobación VP'
+)
+STATUS_COLORS = ('#10b981', '#f59e0b', '#f97316', '#ef4444', '#ef4444')
+STATUS_LABELS_ARRAY = np.array(STATUS_LABELS)
+
+# =============================================================================
+# FUNCIONES DE CÁLCULO
+# =============================================================================
+
+def calculate_price_guidance(customer_id, product_id, quantity, rules=None):
+    rules = rules or RULES.current()
+    customer = CUSTOMERS[customer_id]
+    product = PRODUCTS[product_id]
+    tier_rule = dict(rules.tier_rules[customer['tier']])
+    
+    base_target = tier_rule['target']
+    cat_adj = rules.category_adj.get(product['category'], 0)
+    seg_adj = rules.segment_adj.get(customer['segment'], 0)
+    reg_adj = rules.region_adj.get(customer['region'], 0)
+    
+    adjusted_target = base_target + cat_adj + seg_adj + reg_adj
+    ceiling = tier_rule['ceiling']
+
+    # Quiebre por volumen: corre target y techo, sin pasar el maximo del tier
+    qty_shift = rules.quantity_shift(product_id, product['category'], quantity)
+    if qty_shift:
+        ceiling = min(ceiling + qty_shift, tier_rule['hard_max'])
+        adjusted_target = min(adjusted_target + qty_shift, ceiling)
+    
+    list_price = product['list_price']
+    cost = product['cost']
+    
+    target_price = list_price * (1 - adjusted_target / 100)
+    ceiling_price = list_price * (1 - ceiling / 100)
+    floor_price = cost / (1 - tier_rule['margin_floor'] / 100)
+    
+    target_margin = (target_price - cost) / target_price * 100
+    target_margin_total = (target_price - cost) * quantity
+    
+    return {
+        'list_price': list_price,
+        'cost': cost,
+        'target_discount': adjusted_target,
+        'ceiling_discount': ceiling,
+        'hard_max_discount': tier_rule['hard_max'],
+        'margin_floor': tier_rule['margin_floor'],
+        'target_price': target_price,
+        'ceiling_price': ceiling_price,
+        'floor_price': floor_price,
+        'target_margin_pct': target_margin,
+        'target_margin_total': target_margin_total,
+        'customer': customer,
+        'product': product,
+        'tier_rule': tier_rule,
+        'rules_version': rules.version,
+        'adjustments': {
+            'category': cat_adj,
+            'segment': seg_adj,
+            'region': reg_adj,
+            'quantity': qty_shift
+        }
+    }
+
+
+# Cubos compilados por version de reglas; se conservan los ultimos para los
+# requests que siguen usando un snapshot anterior
+_rule_cube_cache = {}
+RULE_CUBE_CACHE_SIZE = 4
+
+
+def get_rule_cube(rules=None):
+    rules = rules or RULES.current()
+    cube = _rule_cube_cache.get(rules.version)
+    if cube is None:
+        cube = RuleCube(
+            rules.tier_rules, rules.category_adj, rules.segment_adj, rules.region_adj,
+            rules.quantity_breaks
+        )
+        while len(_rule_cube_cache) >= RULE_CUBE_CACHE_SIZE:
+            _rule_cube_cache.pop(next(iter(_rule_cube_cache)))
+        _rule_cube_cache[rules.version] = cube
+    return cube
+
+
+def calculate_price_guidance_batch(deals, product_ids=None, quantities=None, rules=None):
+    """Version vectorizada de calculate_price_guidance.
+
+    Recibe un DataFrame con columnas customer_id, product_id y quantity (o tres
+    arreglos paralelos) y devuelve un DataFrame columnar con los mismos valores
+    que la funcion escalar, una fila por deal.
+    """
+    if isinstance(deals, pd.DataFrame):
+        customer_ids = deals['customer_id'].to_numpy()
+        product_ids = deals['product_id'].to_numpy()
+        quantities = deals['quantity'].to_numpy()
+    else:
+        customer_ids = np.asarray(deals)
+        product_ids = np.asarray(product_ids)
+        quantities = np.asarray(quantities)
+
+    cube = get_rule_cube(rules)
+    cust_idx = CUSTOMERS.locate(customer_ids, 'Cliente')
+    prod_idx = PRODUCTS.locate(product_ids, 'Producto')
+
+    # Los codigos del catalogo se traducen a los del cubo una vez por nivel
+    tier = cube.encode_tier(CUSTOMERS.labels['tier'])[CUSTOMERS.codes('tier')[cust_idx]]
+    segment = cube.encode_segment(CUSTOMERS.labels['segment'])[CUSTOMERS.codes('segment')[cust_idx]]
+    region = cube.encode_region(CUSTOMERS.labels['region'])[CUSTOMERS.codes('region')[cust_idx]]
+    category = cube.encode_category(PRODUCTS.labels['category'])[PRODUCTS.codes('category')[prod_idx]]
+    list_price = PRODUCTS.columns['list_price'][prod_idx]
+    cost = PRODUCTS.columns['cost'][prod_idx]
+
+    bands = cube.lookup(tier, category, segment, region)
+    adjusted_target, ceiling, hard_max, margin_floor = bands.T
+    cat_adj = cube.category_adj[category]
+    seg_adj = cube.segment_adj[segment]
+    reg_adj = cube.region_adj[region]
+
+    qty_shift = cube.quantity_shift(category, quantities, product_ids)
+    adjusted_target, ceiling = _apply_quantity_shift(adjusted_target, ceiling, hard_max, qty_shift)
+
+    # Mismo orden de operaciones que la version escalar (resultados identicos)
+    target_price = list_price * (1 - adjusted_target / 100)
+    ceiling_price = list_price * (1 - ceiling / 100)
+    floor_price = cost / (1 - margin_floor / 100)
+
+    target_margin = (target_price - cost) / target_price * 100
+    target_margin_total = (target_price - cost) * quantities
+
+    return pd.DataFrame({
+        'customer_id': customer_ids,
+        'product_id': product_ids,
+        'quantity': quantities,
+        'list_price': list_price,
+        'cost': cost,
+        'target_discount': adjusted_target,
+        'ceiling_discount': ceiling,
+        'hard_max_discount': hard_max,
+        'margin_floor': margin_floor,
+        'target_price': target_price,
+        'ceiling_price': ceiling_price,
+        'floor_price': floor_price,
+        'target_margin_pct': target_margin,
+        'target_margin_total': target_margin_total,
+        'category_adj': cat_adj,
+        'segment_adj': seg_adj,
+        'region_adj': reg_adj,
+        'quantity_adj': qty_shift
+    })
+
+
+def _apply_quantity_shift(target, ceiling, hard_max, shift):
+    # Igual que la version escalar: solo cambian las lineas con quiebre
+    shifted = shift != 0
+    ceiling = np.where(shifted, np.minimum(ceiling + shift, hard_max), ceiling)
+    target = np.where(shifted, np.minimum(target + shift, ceiling), target)
+    return target, ceiling
+
+
+def guardrails_batch(tiers, categories, segments, regions, rules=None, quantities=None, product_ids=None):
+    """Bandas de descuento y piso de margen por atributos del deal.
+
+    Para extractos historicos donde el cliente/producto no esta en el catalogo:
+    resuelve cada fila directo contra el cubo de reglas. Con `quantities`
+    aplica ademas los quiebres por volumen.
+    """
+    cube = get_rule_cube(rules)
+    category = cube.encode_category(categories)
+    bands = cube.lookup(
+        cube.encode_tier(tiers),
+        category,
+        cube.encode_segment(segments),
+        cube.encode_region(regions)
+    )
+    target, ceiling = bands[:, 0], bands[:, 1]
+    if quantities is not None:
+        shift = cube.quantity_shift(category, np.asarray(quantities, dtype=float), product_ids)
+        target, ceiling = _apply_quantity_shift(target, ceiling, bands[:, 2], shift)
+    return pd.DataFrame({
+        'target_discount': target,
+        'ceiling_discount': ceiling,
+        'hard_max_discount': bands[:, 2],
+        'margin_floor': bands[:, 3]
+    })
+
+
+def evaluate_quote(quoted_price, guidance):
+    discount = (1 - quoted_price / guidance['list_price']) * 100
+    margin = (quoted_price - guidance['cost']) / quoted_price * 100
+    
+    if margin < guidance['margin_floor']:
+        code = STATUS_RED_MARGIN
+    elif discount <= guidance['target_discount']:
+        code = STATUS_GREEN
+    elif discount <= guidance['ceiling_discount']:
+        code = STATUS_YELLOW
+    elif discount <= guidance['hard_max_discount']:
+        code = STATUS_ORANGE
+    else:
+        code = STATUS_RED
+    
+    return {
+        'status': STATUS_LABELS[code],
+        'message': STATUS_MESSAGES[code],
+        'color': STATUS_COLORS[code],
+        'discount': discount,
+        'margin': margin
+    }
+
+
+def evaluate_quote_batch(quoted_prices, guidance):
+    """Version vectorizada de evaluate_quote.
+
+    `guidance` es el DataFrame de calculate_price_guidance_batch (o una tabla
+    con las mismas columnas). Devuelve el codigo de estado como uint8 (ver
+    STATUS_LABELS / decode_status) junto con descuento y margen por cotizacion.
+    """
+    quoted_prices = np.asarray(quoted_prices, dtype=float)
+    list_price = np.asarray(guidance['list_price'], dtype=float)
+    cost = np.asarray(guidance['cost'], dtype=float)
+
+    discount = (1 - quoted_prices / list_price) * 100
+    with np.errstate(divide='ignore', invalid='ignore'):
+        margin = (quoted_prices - cost) / quoted_prices * 100
+
+    status = _discount_status(discount, guidance)
+    status[margin < np.asarray(guidance['margin_floor'])] = STATUS_RED_MARGIN
+
+    return {
+        'status': status,
+        'discount': discount,
+        'margin': margin
+    }
+
+
+def _discount_status(discount, guidance):
+    # Se asigna de menor a mayor prioridad; la ultima condicion que aplica gana
+    status = np.full(discount.shape, STATUS_RED, dtype=np.uint8)
+    status[discount <= np.asarray(guidance['hard_max_discount'])] = STATUS_ORANGE
+    status[discount <= np.asarray(guidance['ceiling_discount'])] = STATUS_YELLOW
+    status[discount <= np.asarray(guidance['target_discount'])] = STATUS_GREEN
+    return status
+
+
+def evaluate_basket(customer_id, lines, rules=None):
+    """Evalua una cotizacion multi-linea de un cliente en una sola pasada.
+
+    `lines` es un DataFrame (o lista de dicts) con product_id, quantity y
+    quoted_price, todos obligatorios y mayores que 0 (si no, ValueError). Cada
+    linea se evalua como en evaluate_quote_batch; el estado del deal compara el
+    margen ponderado del basket contra el margin_floor del tier, de modo que
+    una linea bajo el piso puede compensarse con el resto. Si el basket cumple
+    el piso, el estado es la peor banda de descuento.
+    """
+    rules = rules or RULES.current()
+    lines = pd.DataFrame(lines, columns=['product_id', 'quantity', 'quoted_price'])
+    if lines.empty:
+        raise ValueError("La cotizacion no tiene lineas")
+    incomplete = lines.columns[lines.isna().any()].tolist()
+    if incomplete:
+        raise ValueError(f"Hay lineas sin {', '.join(incomplete)}")
+    margin_floor = rules.tier_rules[CUSTOMERS[customer_id]['tier']]['margin_floor']
+
+    quantities = lines['quantity'].to_numpy(dtype=float)
+    quoted_prices = lines['quoted_price'].to_numpy(dtype=float)
+    if not ((quantities > 0) & (quoted_prices > 0)).all():
+        raise ValueError("quantity y quoted_price deben ser mayores que 0")
+    guidance = calculate_price_guidance_batch(
+        np.full(len(lines), customer_id, dtype=object), lines['product_id'].to_numpy(), quantities, rules
+    )
+    evaluation = evaluate_quote_batch(quoted_prices, guidance)
+
+    revenue = quoted_prices @ quantities
+    cost = guidance['cost'].to_numpy() @ quantities
+    list_revenue = guidance['list_price'].to_numpy() @ quantities
+    margin = (revenue - cost) / revenue * 100
+    discount = (1 - revenue / list_revenue) * 100
+
+    if margin < margin_floor:
+        code = STATUS_RED_MARGIN
+    else:
+        code = int(_discount_status(evaluation['discount'], guidance).max())
+
+    lines = guidance.assign(
+        quoted_price=quoted_prices,
+        discount=evaluation['discount'],
+        margin=evaluation['margin'],
+        status=evaluation['status']
+    )
+
+    return {
+        'status': STATUS_LABELS[code],
+        'message': STATUS_MESSAGES[code],
+        'color': STATUS_COLORS[code],
+        'code': code,
+        'lines': lines,
+        'line_counts': np.bincount(evaluation['status'], minlength=len(STATUS_LABELS)),
+        'revenue': revenue,
+        'cost': cost,
+        'discount': discount,
+        'margin': margin,
+        'margin_floor': margin_floor,
+        'rules_version': rules.version
+    }
+
+
+def decode_status(codes):
+    return STATUS_LABELS_ARRAY[codes]
+
+
+def risk_score_batch(discount, margin, guidance):
+    # Exceso de descuento sobre el target mas faltante de margen bajo el piso,
+    # ambos en pp y normalizados por la banda target -> hard_max del tier.
+    # 0 = en el target, 1 = en el maximo; la politica aprueba el top 5%.
+    target = np.asarray(guidance['target_discount'], dtype=float)
+    band = np.asarray(guidance['hard_max_discount'], dtype=float) - target
+    shortfall = np.maximum(np.asarray(guidance['margin_floor'], dtype=float) - np.asarray(margin), 0)
+    return (np.asarray(discount) - target + shortfall) / band
+
+
+def win_probability(discount):
+    discount = np.asarray(discount, dtype=float)
+    piece = np.searchsorted(WIN_CURVE_BREAKS, discount, side='left')
+    win_prob = WIN_CURVE_START[piece] + (discount - WIN_CURVE_ANCHOR[piece]) * WIN_CURVE_SLOPE[piece]
+    return np.clip(win_prob, WIN_PROB_MIN, WIN_PROB_MAX)
+
+
+def _scenario_matrices(list_price, cost, quantity, discounts, win_prob=None):
+    list_price = np.asarray(list_price, dtype=float)[:, None]
+    cost = np.asarray(cost, dtype=float)[:, None]
+    quantity = np.asarray(quantity, dtype=float)[:, None]
+    discounts = np.asarray(discounts, dtype=float)
+
+    price = list_price * (1 - discounts / 100)
+    margin_per_unit = price - cost
+    with np.errstate(divide='ignore', invalid='ignore'):
+        margin_pct = np.where(price > 0, margin_per_unit / price * 100, 0.0)
+
+    if win_prob is None:
+        win_prob = win_probability(discounts)
+    win_prob = np.broadcast_to(win_prob, price.shape)
+    total_margin = margin_per_unit * quantity
+    expected_margin = win_prob * total_margin
+
+    return {
+        'discount': discounts,
+        'price': price,
+        'margin_pct': margin_pct,
+        'win_prob': win_prob * 100,
+        'total_margin': total_margin,
+        'expected_margin': expected_margin
+    }
+
+
+def simulate_scenarios(guidance, quantity):
+    scenarios = _scenario_matrices([guidance['list_price']], [guidance['cost']], [quantity], DISCOUNT_GRID)
+    return pd.DataFrame({
+        'discount': scenarios['discount'],
+        **{k: v[0] for k, v in scenarios.items() if k != 'discount'}
+    })
+
+
+def simulate_scenarios_batch(guidance, quantities=None, discounts=DISCOUNT_GRID, win_prob=None):
+    """Escenarios de descuento para N deals en una sola llamada.
+
+    `guidance` es el DataFrame de calculate_price_guidance_batch (o cualquier
+    tabla con list_price, cost y quantity). Devuelve la grilla de descuentos y
+    matrices (deals x descuentos) con las mismas columnas que simulate_scenarios.
+    `win_prob` (0-1, deals x descuentos) reemplaza la curva por defecto, p.ej.
+    con WinCurveTable.evaluate de un modelo ajustado.
+    """
+    if quantities is None:
+        quantities = guidance['quantity']
+    return _scenario_matrices(guidance['list_price'], guidance['cost'], quantities, discounts, win_prob)
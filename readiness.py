@@ -0,0 +1,205 @@
+"""
+ACERO INDUSTRIAL - Perfilador de Data Readiness
+Corre sobre un extracto de transacciones los chequeos de la slide 2:
+- nulos en columnas clave (customer / product / price / cost / outcome);
+- identidades contables: extended_amount = quantity x unit_price y
+  margin_dollars = extended_amount - total_cost;
+- rangos validos (descuento 0-100%, cantidades y precios positivos), con el
+  minimo y maximo observados.
+
+El archivo se parte en rangos de bytes alineados a fin de linea y cada
+proceso parsea y perfila su rango por bloques; los parciales (conteos,
+min / max) se combinan al final. Supone un CSV sin saltos de linea dentro de
+campos entre comillas, como los extractos del ERP.
+
+Uso:
+    python readiness.py transacciones.csv --workers 8
+"""
+
+import argparse
+import csv
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+KEY_COLUMNS = ['customer_id', 'product_id', 'unit_price', 'total_cost', 'outcome']
+
+# nombre -> (columna, (columnas del lado derecho), funcion del lado derecho)
+IDENTITIES = {
+    'extended_amount = quantity x unit_price': (
+        'extended_amount', ('quantity', 'unit_price'), lambda q, p: q * p
+    ),
+    'margin_dollars = extended_amount - total_cost': (
+        'margin_dollars', ('extended_amount', 'total_cost'), lambda e, c: e - c
+    )
+}
+
+# columna -> (minimo, maximo, incluye minimo)
+RANGES = {
+    'discount_pct': (0.0, 100.0, True),
+    'quantity': (0.0, np.inf, False),
+    'list_price': (0.0, np.inf, False),
+    'unit_price': (0.0, np.inf, False)
+}
+
+BLOCK_BYTES = 64 * 1024 * 1024
+
+
+def _required_columns():
+    columns = set(KEY_COLUMNS) | set(RANGES)
+    for column, inputs, _ in IDENTITIES.values():
+        columns.add(column)
+        columns.update(inputs)
+    return columns
+
+
+def profile_frame(frame, tolerance=0.01):
+    """Parciales de un bloque: conteos de fallas y min / max por chequeo."""
+    partial = {'rows': len(frame)}
+    for column in KEY_COLUMNS:
+        partial[('null', column)] = int(frame[column].isna().sum())
+
+    for name, (column, inputs, rhs) in IDENTITIES.items():
+        expected = rhs(*(frame[c].to_numpy(dtype=float) for c in inputs))
+        error = np.abs(frame[column].to_numpy(dtype=float) - expected)
+        partial[('identity', name)] = int(np.count_nonzero(~(error <= tolerance)))
+        partial[('identity_max', name)] = float(np.nanmax(error)) if len(error) else 0.0
+
+    for column, (low, high, closed) in RANGES.items():
+        values = frame[column].to_numpy(dtype=float)
+        above_low = values >= low if closed else values > low
+        partial[('range', column)] = int(np.count_nonzero(~(above_low & (values <= high))))
+        partial[('min', column)] = float(np.nanmin(values)) if len(values) else np.inf
+        partial[('max', column)] = float(np.nanmax(values)) if len(values) else -np.inf
+    return partial
+
+
+_MERGE = {'min': min, 'max': max, 'identity_max': max}
+
+
+def merge_profiles(partials):
+    merged = {}
+    for partial in partials:
+        for key, value in partial.items():
+            if key not in merged:
+                merged[key] = value
+                continue
+            op = _MERGE.get(key[0]) if isinstance(key, tuple) else None
+            merged[key] = op(merged[key], value) if op else merged[key] + value
+    return merged
+
+
+def split_ranges(path, parts):
+    """Rangos (inicio, fin) de bytes alineados a fin de linea, sin el header."""
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        header = f.readline()
+        start = f.tell()
+        bounds = [start]
+        for i in range(1, parts):
+            f.seek(max(start + (size - start) * i // parts, bounds[-1]))
+            f.readline()
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    ranges = [(a, b) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+    # utf-8-sig descarta el BOM de los exports de Excel / ERP
+    columns = next(csv.reader([header.decode('utf-8-sig')]), [])
+    return [c.strip() for c in columns], ranges
+
+
+def _check_header(path, header):
+    missing = _required_columns() - set(header)
+    if missing:
+        raise ValueError(f"Faltan columnas en {path}: {', '.join(sorted(missing))}")
+
+
+def _profile_range(path, start, end, header, tolerance, block_bytes=BLOCK_BYTES):
+    required = _required_columns()
+    _check_header(path, header)
+
+    partials = []
+    with open(path, 'rb') as f:
+        f.seek(start)
+        while f.tell() < end:
+            block = f.read(min(block_bytes, end - f.tell()))
+            if f.tell() < end:
+                # Completa la ultima linea del bloque
+                block += f.readline()
+            frame = pd.read_csv(
+                io.BytesIO(block),
+                header=None,
+                names=header,
+                usecols=lambda c: c in required,
+                dtype={'customer_id': str, 'product_id': str, 'outcome': str}
+            )
+            partials.append(profile_frame(frame, tolerance))
+    return merge_profiles(partials)
+
+
+def profile_file(path, workers=None, tolerance=0.01):
+    """Perfil completo del archivo (parciales de todos los rangos combinados)."""
+    workers = workers or os.cpu_count() or 1
+    # Mas rangos que procesos para balancear la carga
+    header, ranges = split_ranges(path, workers * 4 if workers > 1 else 1)
+    _check_header(path, header)
+
+    if not ranges:
+        # Solo header: perfil de cero filas
+        return profile_frame(pd.DataFrame({c: pd.Series(dtype=float) for c in _required_columns()}), tolerance)
+    if workers <= 1:
+        partials = [_profile_range(path, a, b, header, tolerance) for a, b in ranges]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_profile_range, path, a, b, header, tolerance) for a, b in ranges]
+            partials = [f.result() for f in futures]
+    return merge_profiles(partials)
+
+
+def readiness_report(profile):
+    """Tabla chequeo / detalle / fallas / % / min / max / ok."""
+    rows = profile['rows']
+    report = []
+    for column in KEY_COLUMNS:
+        report.append(('nulos', column, profile[('null', column)], np.nan, np.nan))
+    for name in IDENTITIES:
+        report.append(('identidad', name, profile[('identity', name)], np.nan, profile[('identity_max', name)]))
+    for column, (low, high, closed) in RANGES.items():
+        bracket = '[' if closed else '('
+        upper = f"{high:g}]" if np.isfinite(high) else "inf)"
+        report.append(('rango', f"{column} {bracket}{low:g}, {upper}", profile[('range', column)],
+                       profile[('min', column)], profile[('max', column)]))
+
+    table = pd.DataFrame(report, columns=['chequeo', 'detalle', 'fallas', 'min', 'max'])
+    table.insert(3, 'pct_fallas', table['fallas'] / rows * 100 if rows else 0.0)
+    table['ok'] = table['fallas'] == 0
+    if not rows:
+        table[['min', 'max']] = np.nan
+    return table
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Chequeos de data readiness sobre un extracto de transacciones.")
+    parser.add_argument('input', help="CSV de transacciones")
+    parser.add_argument('--workers', type=int, default=None, help="Procesos (default: nucleos disponibles)")
+    parser.add_argument('--tolerance', type=float, default=0.01, help="Tolerancia de las identidades en $ (default: 0.01)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        profile = profile_file(args.input, args.workers, args.tolerance)
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"error: {exc}\n")
+    elapsed = time.perf_counter() - start
+
+    print(readiness_report(profile).to_string(index=False, float_format='{:,.4f}'.format))
+    print(f"{profile['rows']:,} filas en {elapsed:.1f}s ({profile['rows'] / elapsed:,.0f} filas/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+ACERO INDUSTRIAL - Cubo de Reglas Compilado
+Convierte TIER_RULES y los ajustes por categoria, segmento y region en
+dimensiones codificadas como enteros y un cubo denso (tier x categoria x
+segmento x region) con target ajustado, techo, maximo y piso de margen.
+Cada deal se resuelve con un solo lookup indexado.
+
+Los quiebres por volumen (QuantityBreaks) se compilan a arreglos ordenados
+por categoria o SKU y se resuelven con searchsorted: O(log quiebres) por
+linea, vectorizado por tabla.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Columnas del cubo (ultimo eje de RuleCube.table)
+CUBE_FIELDS = ('target', 'ceiling', 'hard_max', 'margin_floor')
+
+
+class QuantityBreaks:
+    # Tablas por categoria y por SKU (la del SKU tiene prioridad). Cada tabla:
+    # min_quantity estrictamente creciente y el shift (pp) que se suma a target
+    # y techo desde ese minimo; bajo el primer minimo el shift es 0.
+
+    def __init__(self, by_category=None, by_product=None):
+        by_category = by_category or {}
+        by_product = by_product or {}
+        self.categories = tuple(by_category)
+        self.products = tuple(by_product)
+        self._mins = []
+        self._shifts = []
+        for name, table in [*by_category.items(), *by_product.items()]:
+            mins = np.asarray(table['min_quantity'], dtype=float)
+            shifts = np.asarray(table['shift'], dtype=float)
+            if mins.ndim != 1 or len(mins) != len(shifts) or np.any(np.diff(mins) <= 0):
+                raise ValueError(f"Tabla de quiebres invalida para {name}")
+            self._mins.append(mins)
+            self._shifts.append(np.concatenate([[0.0], shifts]))
+
+    def __bool__(self):
+        return bool(self._mins)
+
+    def groups(self, categories, product_ids=None):
+        """Tabla que aplica a cada linea (-1 = sin quiebres)."""
+        groups = pd.Index(self.categories).get_indexer(np.asarray(categories, dtype=object))
+        return self.override_products(groups, product_ids)
+
+    def override_products(self, groups, product_ids):
+        """Reemplaza la tabla de categoria por la del SKU cuando existe."""
+        if not self.products or product_ids is None:
+            return groups
+        sku = pd.Index(self.products).get_indexer(np.asarray(product_ids, dtype=object))
+        return np.where(sku >= 0, len(self.categories) + sku, groups)
+
+    def shift(self, groups, quantities):
+        groups = np.asarray(groups)
+        quantities = np.broadcast_to(np.asarray(quantities, dtype=float), groups.shape)
+        shift = np.zeros(groups.shape)
+        for group in np.unique(groups[groups >= 0]):
+            rows = groups == group
+            shift[rows] = self._shifts[group][np.searchsorted(self._mins[group], quantities[rows], side='right')]
+        return shift
+
+
+class RuleCube:
+    # Cada dimension de ajuste lleva un slot extra al final para valores no
+    # configurados (ajuste 0), igual que el `.get(..., 0)` de la version escalar.
+
+    def __init__(self, tier_rules, category_adj, segment_adj, region_adj, quantity_breaks=None):
+        self.tiers = tuple(tier_rules)
+        self.categories = tuple(category_adj)
+        self.segments = tuple(segment_adj)
+        self.regions = tuple(region_adj)
+
+        self.tier_target = np.array([tier_rules[t]['target'] for t in self.tiers], dtype=float)
+        self.tier_ceiling = np.array([tier_rules[t]['ceiling'] for t in self.tiers], dtype=float)
+        self.tier_hard_max = np.array([tier_rules[t]['hard_max'] for t in self.tiers], dtype=float)
+        self.tier_margin_floor = np.array([tier_rules[t]['margin_floor'] for t in self.tiers], dtype=float)
+
+        self.category_adj = np.append(np.array(list(category_adj.values()), dtype=float), 0.0)
+        self.segment_adj = np.append(np.array(list(segment_adj.values()), dtype=float), 0.0)
+        self.region_adj = np.append(np.array(list(region_adj.values()), dtype=float), 0.0)
+
+        # Mismo orden de suma que calculate_price_guidance: tier + cat + seg + reg
+        target = (
+            self.tier_target[:, None, None, None]
+            + self.category_adj[None, :, None, None]
+            + self.segment_adj[None, None, :, None]
+            + self.region_adj[None, None, None, :]
+        )
+        self.shape = target.shape
+
+        table = np.empty(self.shape + (len(CUBE_FIELDS),))
+        table[..., 0] = target
+        table[..., 1] = self.tier_ceiling[:, None, None, None]
+        table[..., 2] = self.tier_hard_max[:, None, None, None]
+        table[..., 3] = self.tier_margin_floor[:, None, None, None]
+        self.table = table
+        self._flat = table.reshape(-1, len(CUBE_FIELDS))
+
+        quantity_breaks = quantity_breaks or {}
+        self.breaks = QuantityBreaks(quantity_breaks.get('category'), quantity_breaks.get('product'))
+        # Tabla de quiebres por codigo de categoria del cubo (slot extra: ninguna)
+        self._category_break_group = np.append(self.breaks.groups(self.categories), -1)
+
+    def encode_tier(self, values):
+        codes = pd.Index(self.tiers).get_indexer(np.asarray(values, dtype=object))
+        if (codes < 0).any():
+            missing = pd.unique(np.asarray(values, dtype=object)[codes < 0])
+            raise KeyError(f"Tier desconocido(s): {', '.join(map(str, missing[:5]))}")
+        return codes
+
+    def encode_category(self, values):
+        return self._encode(self.categories, values)
+
+    def encode_segment(self, values):
+        return self._encode(self.segments, values)
+
+    def encode_region(self, values):
+        return self._encode(self.regions, values)
+
+    @staticmethod
+    def _encode(labels, values):
+        codes = pd.Index(labels).get_indexer(np.asarray(values, dtype=object))
+        codes[codes < 0] = len(labels)
+        return codes
+
+    def cell_index(self, tier, category, segment, region):
+        return np.ravel_multi_index((tier, category, segment, region), self.shape)
+
+    def lookup(self, tier, category, segment, region):
+        """Devuelve un arreglo (N x 4) con target, ceiling, hard_max, margin_floor."""
+        return self._flat[self.cell_index(tier, category, segment, region)]
+
+    def quantity_shift(self, category, quantities, product_ids=None):
+        """Shift por volumen (pp) por linea; `category` son codigos del cubo."""
+        groups = self.breaks.override_products(self._category_break_group[category], product_ids)
+        return self.breaks.shift(groups, quantities)
@@ -0,0 +1,188 @@
+"""
+ACERO INDUSTRIAL - Snapshots de Reglas de Guardrails
+Las reglas (TIER_RULES, ajustes por categoria, segmento y region y quiebres
+por volumen) viven en un archivo JSON externo (data/rules.json) y se cargan
+como snapshots inmutables identificados por el hash de su contenido.
+
+RuleStore mantiene el snapshot vigente y revisa el archivo a lo sumo cada
+`check_interval` segundos; si cambio, valida el nuevo contenido y reemplaza
+la referencia de forma atomica. Un request que ya tomo su snapshot lo sigue
+usando hasta terminar. Los caches derivados (cubo de reglas, graficos) se
+indexan por `snapshot.version`, asi que un cambio de reglas solo invalida lo
+que depende de ellas. Si el archivo nuevo es invalido se conserva el
+snapshot anterior y el error queda en `RuleStore.error`.
+"""
+
+import bisect
+import hashlib
+import json
+import math
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+
+from catalog import DATA_DIR
+
+RULES_PATH = DATA_DIR / 'rules.json'
+RULE_SECTIONS = ('tier_rules', 'category_adj', 'segment_adj', 'region_adj')
+# Opcional: {'category': {cat: tabla}, 'product': {sku: tabla}} con
+# tabla = {'min_quantity': [...], 'shift': [...]}
+BREAK_SECTION = 'quantity_breaks'
+TIER_FIELDS = ('target', 'ceiling', 'hard_max', 'margin_floor')
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+def rules_hash(rules):
+    canonical = json.dumps(rules, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:12]
+
+
+def validate_rules(rules):
+    missing = [s for s in RULE_SECTIONS if s not in rules]
+    if missing:
+        raise ValueError(f"Faltan secciones de reglas: {', '.join(missing)}")
+
+    if not rules['tier_rules']:
+        raise ValueError("tier_rules no tiene tiers")
+    for tier, rule in rules['tier_rules'].items():
+        missing = [f for f in TIER_FIELDS if f not in rule]
+        if missing:
+            raise ValueError(f"Tier {tier}: faltan {', '.join(missing)}")
+        invalid = [f for f in TIER_FIELDS if not _is_number(rule[f])]
+        if invalid:
+            raise ValueError(f"Tier {tier}: {', '.join(invalid)} no es numerico")
+        if not rule['target'] <= rule['ceiling'] <= rule['hard_max']:
+            raise ValueError(f"Tier {tier}: se requiere target <= ceiling <= hard_max")
+        if not 0 <= rule['margin_floor'] < 100:
+            raise ValueError(f"Tier {tier}: margin_floor fuera de [0, 100)")
+
+    for section in RULE_SECTIONS[1:]:
+        for level, value in rules[section].items():
+            if not _is_number(value):
+                raise ValueError(f"{section}[{level}] no es numerico")
+
+    breaks = rules.get(BREAK_SECTION, {})
+    for scope in breaks:
+        if scope not in ('category', 'product'):
+            raise ValueError(f"{BREAK_SECTION}: alcance desconocido '{scope}'")
+    for category in breaks.get('category', {}):
+        if category not in rules['category_adj']:
+            raise ValueError(f"{BREAK_SECTION}: categoria '{category}' no esta en category_adj")
+    for scope, tables in breaks.items():
+        for name, table in tables.items():
+            mins, shifts = table['min_quantity'], table['shift']
+            if not all(_is_number(v) for v in (*mins, *shifts)):
+                raise ValueError(f"{BREAK_SECTION}[{name}]: min_quantity y shift deben ser numericos")
+            if len(mins) != len(shifts) or any(b <= a for a, b in zip(mins, mins[1:])):
+                raise ValueError(f"{BREAK_SECTION}[{name}]: min_quantity debe ser creciente y del largo de shift")
+
+
+class RuleSnapshot:
+    # Inmutable: las secciones son MappingProxyType y no hay setters
+
+    __slots__ = (
+        'version', 'source', 'loaded_at',
+        'tier_rules', 'category_adj', 'segment_adj', 'region_adj', 'quantity_breaks'
+    )
+
+    def __init__(self, rules, source=None):
+        validate_rules(rules)
+        object.__setattr__(self, 'version', rules_hash(rules))
+        object.__setattr__(self, 'source', source)
+        object.__setattr__(self, 'loaded_at', time.time())
+        for section in RULE_SECTIONS:
+            object.__setattr__(self, section, _freeze(rules[section]))
+        breaks = {scope: {name: {'min_quantity': tuple(t['min_quantity']), 'shift': tuple(t['shift'])}
+                          for name, t in tables.items()}
+                  for scope, tables in rules.get(BREAK_SECTION, {}).items()}
+        object.__setattr__(self, 'quantity_breaks', _freeze(breaks))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RuleSnapshot es inmutable")
+
+    def __repr__(self):
+        return f"RuleSnapshot(version={self.version!r}, source={self.source!r})"
+
+    def to_dict(self):
+        return {
+            'tier_rules': {tier: dict(rule) for tier, rule in self.tier_rules.items()},
+            'category_adj': dict(self.category_adj),
+            'segment_adj': dict(self.segment_adj),
+            'region_adj': dict(self.region_adj),
+            BREAK_SECTION: {
+                scope: {name: {k: list(v) for k, v in table.items()} for name, table in tables.items()}
+                for scope, tables in self.quantity_breaks.items()
+            }
+        }
+
+    def quantity_shift(self, product_id, category, quantity):
+        """Shift por volumen (pp) de una linea: tabla del SKU o de su categoria."""
+        table = self.quantity_breaks.get('product', {}).get(product_id)
+        if table is None:
+            table = self.quantity_breaks.get('category', {}).get(category)
+        if table is None:
+            return 0.0
+        i = bisect.bisect_right(table['min_quantity'], quantity)
+        return table['shift'][i - 1] if i else 0.0
+
+
+def load_snapshot(path=RULES_PATH):
+    path = Path(path)
+    return RuleSnapshot(json.loads(path.read_text(encoding='utf-8')), source=str(path))
+
+
+def _signature(path):
+    stat = Path(path).stat()
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+class RuleStore:
+
+    def __init__(self, path=RULES_PATH, check_interval=2.0):
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self.error = None
+        self._lock = threading.Lock()
+        self._signature = _signature(self.path)
+        self._snapshot = load_snapshot(self.path)
+        self._checked = time.monotonic()
+
+    def current(self):
+        """Snapshot vigente (revisa el archivo a lo sumo cada check_interval s)."""
+        if self.check_interval is not None and time.monotonic() - self._checked >= self.check_interval:
+            self.refresh()
+        return self._snapshot
+
+    def refresh(self):
+        """Recarga el archivo si cambio; devuelve el snapshot vigente."""
+        self._checked = time.monotonic()
+        try:
+            signature = _signature(self.path)
+        except OSError as exc:
+            self.error = exc
+            return self._snapshot
+        if signature == self._signature:
+            return self._snapshot
+
+        with self._lock:
+            if signature != self._signature:
+                self._signature = signature
+                try:
+                    snapshot = load_snapshot(self.path)
+                except (OSError, ValueError, KeyError, TypeError) as exc:
+                    self.error = exc
+                else:
+                    self.error = None
+                    if snapshot.version != self._snapshot.version:
+                        self._snapshot = snapshot
+        return self._snapshot
@@ -0,0 +1,126 @@
+"""
+ACERO INDUSTRIAL - Indice de Busqueda para Selectores
+Typeahead sobre codigo y nombre de productos / clientes: los selectores de la
+demo envian al navegador solo los top-k resultados y no el catalogo completo.
+
+- Prefijos: tokens normalizados (minusculas, sin tildes) en un arreglo
+  ordenado; cada termino se resuelve con dos searchsorted.
+- Subcadenas: indice de trigramas para terminos que aparecen dentro de una
+  palabra sin ser su prefijo (p.ej. "mina" en "Lámina").
+
+Todos los terminos de la consulta deben coincidir (AND). Orden: codigo exacto,
+prefijo de codigo, palabra exacta, prefijo de palabra, subcadena.
+"""
+
+import re
+import unicodedata
+
+import numpy as np
+
+SCORE_CODE_EXACT = 100
+SCORE_CODE_PREFIX = 50
+SCORE_WORD_EXACT = 20
+SCORE_WORD_PREFIX = 10
+SCORE_SUBSTRING = 1
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+_MAX_CHAR = '\U0010ffff'
+
+
+def normalize(text):
+    text = unicodedata.normalize('NFKD', str(text)).encode('ascii', 'ignore').decode()
+    return text.lower()
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall(normalize(text))
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+
+    def __init__(self, ids, names):
+        self.ids = [str(i) for i in ids]
+        self.names = [str(n) for n in names]
+        self._labels = {i: f"{i} - {n}" for i, n in zip(self.ids, self.names)}
+
+        tokens, entries, is_code = [], [], []
+        self._texts = []
+        trigrams = {}
+        for position, (item_id, name) in enumerate(zip(self.ids, self.names)):
+            code_tokens = tokenize(item_id)
+            name_tokens = tokenize(name)
+            for token in code_tokens + name_tokens:
+                tokens.append(token)
+                entries.append(position)
+            is_code += [True] * len(code_tokens) + [False] * len(name_tokens)
+
+            text = ' '.join(code_tokens + name_tokens)
+            self._texts.append(text)
+            for gram in _trigrams(text):
+                trigrams.setdefault(gram, []).append(position)
+
+        order = np.argsort(np.array(tokens, dtype=str), kind='stable')
+        self._tokens = np.array(tokens, dtype=str)[order]
+        self._entries = np.array(entries, dtype=np.int64)[order]
+        self._is_code = np.array(is_code, dtype=bool)[order]
+        self._trigrams = {gram: np.array(p, dtype=np.int64) for gram, p in trigrams.items()}
+
+    @classmethod
+    def from_catalog(cls, catalog, name_column='name'):
+        return cls(catalog.ids.tolist(), catalog.values(name_column).tolist())
+
+    def __len__(self):
+        return len(self.ids)
+
+    def label(self, item_id):
+        return self._labels.get(item_id, item_id)
+
+    def _term_scores(self, term):
+        scores = np.zeros(len(self.ids))
+        lo = np.searchsorted(self._tokens, term, side='left')
+        hi = np.searchsorted(self._tokens, term + _MAX_CHAR, side='left')
+        if hi > lo:
+            exact = self._tokens[lo:hi] == term
+            code = self._is_code[lo:hi]
+            token_scores = np.where(
+                code,
+                np.where(exact, SCORE_CODE_EXACT, SCORE_CODE_PREFIX),
+                np.where(exact, SCORE_WORD_EXACT, SCORE_WORD_PREFIX)
+            )
+            np.maximum.at(scores, self._entries[lo:hi], token_scores)
+
+        if len(term) >= 3:
+            # Candidatos por interseccion de trigramas; con mas de 3 letras se
+            # confirma la subcadena completa
+            grams = _trigrams(term)
+            postings = [self._trigrams.get(gram) for gram in grams]
+            if all(p is not None for p in postings):
+                candidates = postings[0]
+                for p in postings[1:]:
+                    candidates = np.intersect1d(candidates, p, assume_unique=True)
+                candidates = candidates[scores[candidates] == 0]
+                if len(term) > 3:
+                    candidates = [c for c in candidates.tolist() if term in self._texts[c]]
+                scores[candidates] = SCORE_SUBSTRING
+        return scores
+
+    def search(self, query, k=20):
+        """Top-k ids que coinciden con todos los terminos de `query`."""
+        terms = tokenize(query)
+        if not terms:
+            return self.ids[:k]
+
+        total = np.zeros(len(self.ids))
+        mask = np.ones(len(self.ids), dtype=bool)
+        for term in terms:
+            scores = self._term_scores(term)
+            mask &= scores > 0
+            total += scores
+
+        candidates = np.flatnonzero(mask)
+        order = np.lexsort((candidates, -total[candidates]))[:k]
+        return [self.ids[i] for i in candidates[order]]
@@ -0,0 +1,236 @@
+"""
+ACERO INDUSTRIAL - Servicio de Precios (HTTP, sin Streamlit)
+Expone el motor de precios para integraciones CPQ / ERP. Las reglas y el
+cubo compilado se cargan al arrancar; si cambia data/rules.json se recargan
+sin reiniciar (ver rules.py) y /health informa la version vigente.
+
+Endpoints (JSON):
+    POST /guidance   {customer_id, product_id, quantity}
+    POST /evaluate   {customer_id, product_id, quantity, quoted_price}
+    POST /scenarios  {customer_id, product_id, quantity}
+    POST /batch      {lines: [{customer_id, product_id, quantity, quoted_price?}, ...]}
+    POST /basket     {customer_id, lines: [{product_id, quantity, quoted_price}, ...]}
+    GET  /stats      latencia p50 / p99 por endpoint
+    GET  /health
+
+Uso:
+    python service.py --port 8080
+"""
+
+import argparse
+import json
+import math
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from pricing import (
+    RULES,
+    calculate_price_guidance,
+    calculate_price_guidance_batch,
+    decode_status,
+    evaluate_basket,
+    evaluate_quote,
+    evaluate_quote_batch,
+    get_rule_cube,
+    simulate_scenarios,
+)
+
+# Muestras de latencia que se guardan por endpoint para los percentiles
+LATENCY_WINDOW = 10_000
+
+
+class LatencyTracker:
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.window = window
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint, seconds):
+        with self._lock:
+            if endpoint not in self._samples:
+                self._samples[endpoint] = deque(maxlen=self.window)
+            self._samples[endpoint].append(seconds)
+
+    def summary(self):
+        with self._lock:
+            samples = {k: np.array(v) for k, v in self._samples.items()}
+        return {
+            endpoint: {
+                'count': len(values),
+                'p50_ms': float(np.percentile(values, 50) * 1000),
+                'p99_ms': float(np.percentile(values, 99) * 1000)
+            }
+            for endpoint, values in samples.items()
+        }
+
+
+def _guidance(body, rules):
+    return calculate_price_guidance(body['customer_id'], body['product_id'], body['quantity'], rules)
+
+
+def handle_guidance(body, rules):
+    return _guidance(body, rules)
+
+
+def _check_prices(prices):
+    if not (np.asarray(prices, dtype=float) > 0).all():
+        raise ValueError("quoted_price debe ser mayor que 0")
+
+
+def handle_evaluate(body, rules):
+    _check_prices(body['quoted_price'])
+    guidance = _guidance(body, rules)
+    evaluation = evaluate_quote(body['quoted_price'], guidance)
+    return {**evaluation, 'guidance': {k: guidance[k] for k in (
+        'target_price', 'ceiling_price', 'floor_price',
+        'target_discount', 'ceiling_discount', 'hard_max_discount', 'margin_floor'
+    )}}
+
+
+def handle_scenarios(body, rules):
+    scenarios = simulate_scenarios(_guidance(body, rules), body['quantity'])
+    return {column: scenarios[column].tolist() for column in scenarios.columns}
+
+
+def handle_batch(body, rules):
+    lines = pd.DataFrame(body['lines'])
+    guidance = calculate_price_guidance_batch(lines, rules=rules)
+    result = {column: guidance[column].tolist() for column in guidance.columns}
+
+    if 'quoted_price' in lines.columns:
+        _check_prices(lines['quoted_price'].dropna())
+        evaluation = evaluate_quote_batch(lines['quoted_price'], guidance)
+        result['discount'] = evaluation['discount'].tolist()
+        result['margin'] = evaluation['margin'].tolist()
+        # Las lineas sin quoted_price solo reciben guia, sin estado
+        status = decode_status(evaluation['status']).astype(object)
+        status[lines['quoted_price'].isna().to_numpy()] = None
+        result['status'] = status.tolist()
+    return {'count': len(lines), 'rules_version': rules.version, 'lines': result}
+
+
+def handle_basket(body, rules):
+    basket = evaluate_basket(body['customer_id'], body['lines'], rules)
+    lines = basket['lines']
+    return {
+        'customer_id': body['customer_id'],
+        'rules_version': rules.version,
+        'status': basket['status'],
+        'message': basket['message'],
+        'revenue': basket['revenue'],
+        'discount': basket['discount'],
+        'margin': basket['margin'],
+        'margin_floor': basket['margin_floor'],
+        'lines': {
+            'product_id': lines['product_id'].tolist(),
+            'target_price': lines['target_price'].tolist(),
+            'floor_price': lines['floor_price'].tolist(),
+            'discount': lines['discount'].tolist(),
+            'margin': lines['margin'].tolist(),
+            'status': decode_status(lines['status'].to_numpy()).tolist()
+        }
+    }
+
+
+ROUTES = {
+    '/guidance': handle_guidance,
+    '/evaluate': handle_evaluate,
+    '/scenarios': handle_scenarios,
+    '/batch': handle_batch,
+    '/basket': handle_basket
+}
+
+
+def _json_safe(value):
+    # JSON estricto para clientes CPQ / ERP: NaN e Infinity se envian como null
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    return value
+
+
+class PricingHandler(BaseHTTPRequestHandler):
+    latency = LatencyTracker()
+
+    def _send(self, status, payload):
+        data = json.dumps(_json_safe(payload), allow_nan=False).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == '/health':
+            rules = RULES.current()
+            error = None if RULES.error is None else str(RULES.error)
+            self._send(200, {'status': 'ok', 'rules_version': rules.version, 'rules_error': error})
+        elif self.path == '/stats':
+            self._send(200, self.latency.summary())
+        else:
+            self._send(404, {'error': f"Ruta desconocida: {self.path}"})
+
+    def do_POST(self):
+        handler = ROUTES.get(self.path)
+        if handler is None:
+            self._send(404, {'error': f"Ruta desconocida: {self.path}"})
+            return
+
+        start = time.perf_counter()
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            body = json.loads(self.rfile.read(length) or b'{}')
+            # Un snapshot de reglas por request, aunque se recargue a mitad de camino
+            status, payload = 200, handler(body, RULES.current())
+        except json.JSONDecodeError as exc:
+            status, payload = 400, {'error': f"JSON invalido: {exc}"}
+        except KeyError as exc:
+            status, payload = 400, {'error': f"Campo o codigo desconocido: {exc.args[0]}"}
+        except (TypeError, ValueError) as exc:
+            status, payload = 400, {'error': str(exc)}
+        except Exception as exc:
+            traceback.print_exc()
+            status, payload = 500, {'error': f"Error interno: {type(exc).__name__}"}
+        self._send(status, payload)
+        self.latency.record(self.path, time.perf_counter() - start)
+
+    def log_message(self, format, *args):
+        # Sin log por request; la latencia se reporta en /stats
+        pass
+
+
+def make_server(host='127.0.0.1', port=8080):
+    get_rule_cube()
+    return ThreadingHTTPServer((host, port), PricingHandler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servicio HTTP del motor de precios.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port)
+    print(f"Sirviendo en http://{args.host}:{args.port}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
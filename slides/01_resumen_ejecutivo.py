@@ -0,0 +1,79 @@
+"""
+Slide 01 / 08 - Resumen Ejecutivo
+"""
+
+import streamlit as st
+
+# =============================================================================
+# SLIDE 1: RESUMEN EJECUTIVO
+# =============================================================================
+
+st.markdown('<p class="main-title">Acero Industrial</p>', unsafe_allow_html=True)
+st.markdown('<p class="subtitle">Evaluacion de Preparacion de Datos para Optimizacion de Precios</p>', unsafe_allow_html=True)
+
+st.markdown("---")
+
+col1, col2 = st.columns([2, 1])
+
+with col1:
+    st.markdown('<p class="slide-number">Slide 01 / 08</p>', unsafe_allow_html=True)
+    st.markdown('<h2 class="slide-title">Resumen Ejecutivo</h2>', unsafe_allow_html=True)
+
+    with st.container():
+        st.markdown('<p class="section-title">Contexto del Proyecto</p>', unsafe_allow_html=True)
+        st.markdown("""
+        <p class="bullet-item">Distribuidor de acero colombiano con <strong style="color: #10b981;">$185M</strong> en ingresos</p>
+        <p class="bullet-item">Margen actual: <strong style="color: #f59e0b;">18.2%</strong> vs objetivo: <strong style="color: #10b981;">20%</strong></p>
+        <p class="bullet-item">823 clientes, 4,847 SKUs, 42 representantes de ventas</p>
+        <p class="bullet-item">Sistema PriceFx implementado pero sin optimización efectiva</p>
+        """, unsafe_allow_html=True)
+
+        st.markdown('<p class="section-title">Hallazgo Principal</p>', unsafe_allow_html=True)
+        st.markdown("""
+        <div class="highlight-box">
+            <strong style="color: #10b981;">Los datos reflejan comportamiento PRE-OPTIMIZACION.</strong><br><br>
+            Entrenar un modelo ML replicaria las ineficiencias actuales, no las corregiria.
+            Un enfoque de guardrails + reglas es mas efectivo para este contexto.
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown('<p class="section-title">Resultado del Sistema Propuesto</p>', unsafe_allow_html=True)
+        st.markdown("""
+        <p class="bullet-item">GM Invoice: <strong style="color: #10b981;">~22%</strong> (vs target 20%)</p>
+        <p class="bullet-item">Aprobaciones humanas: solo <strong style="color: #3b82f6;">5%</strong> de deals</p>
+        <p class="bullet-item">Reduccion de erosion: <strong style="color: #f59e0b;">~70%</strong></p>
+        <p class="bullet-item">22% de deals sin descuento (antes: descuento "por defecto")</p>
+        """, unsafe_allow_html=True)
+
+with col2:
+    st.markdown("""
+    <div class="metric-card metric-card-green">
+        <p class="metric-label">GM Invoice Final</p>
+        <p class="metric-value">22.17%</p>
+        <p class="metric-subtitle">Target: 20%</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="metric-card metric-card-blue">
+        <p class="metric-label">Aprobaciones Humanas</p>
+        <p class="metric-value">5%</p>
+        <p class="metric-subtitle">Solo deals de alto riesgo</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="metric-card metric-card-orange">
+        <p class="metric-label">Reduccion de Drift</p>
+        <p class="metric-value">-70%</p>
+        <p class="metric-subtitle">De -3.8% a -1.1%</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="metric-card metric-card-purple">
+        <p class="metric-label">Deals Sin Descuento</p>
+        <p class="metric-value">22.5%</p>
+        <p class="metric-subtitle">1 de cada 4 deals</p>
+    </div>
+    """, unsafe_allow_html=True)
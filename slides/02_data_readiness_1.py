@@ -0,0 +1,95 @@
+"""
+Slide 02 / 08 - Data Readiness (Parte 1)
+"""
+
+import streamlit as st
+
+from charts import inconsistency_figure
+
+# =============================================================================
+# SLIDE 2: DATA READINESS (PARTE 1)
+# =============================================================================
+
+st.markdown('<p class="slide-number">Slide 02 / 08</p>', unsafe_allow_html=True)
+st.markdown('<h1 class="slide-title">1. Data Readiness Assessment (Parte 1)</h1>', unsafe_allow_html=True)
+st.markdown('<p class="subtitle" style="font-size: 1rem;">Que datos son usables y que falta</p>', unsafe_allow_html=True)
+
+col1, col2 = st.columns([1, 1])
+
+with col1:
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h3 style="color: #10b981; font-family: Crimson Pro, serif;">Datos Usables (Para Empezar Ya)</h3>', unsafe_allow_html=True)
+
+    st.markdown('<p class="section-title">A. Integridad y Consistencia Aritmetica</p>', unsafe_allow_html=True)
+    st.markdown("""
+    <p class="bullet-item">0 nulos en columnas clave (customer/product/price/cost/outcome)</p>
+    <p class="bullet-item">Identidades contables consistentes</p>
+    <p class="bullet-item"><code style="color: #10b981;">extended_amount = quantity x unit_price</code></p>
+    <p class="bullet-item"><code style="color: #10b981;">margin_dollars = extended_amount - total_cost</code></p>
+    """, unsafe_allow_html=True)
+
+    st.markdown('<p class="section-title">B. Senal Suficiente para Segmentacion</p>', unsafe_allow_html=True)
+    st.markdown("""
+    <p class="bullet-item">200 clientes, 24 productos en el extracto</p>
+    <p class="bullet-item">Segmentos y tiers bien poblados</p>
+    <p class="bullet-item">Permite arrancar con pricing por segmentos</p>
+    """, unsafe_allow_html=True)
+
+    st.markdown('<p class="section-title">C. Variacion Real en Descuentos</p>', unsafe_allow_html=True)
+    st.markdown("""
+    <p class="bullet-item">Rango de descuento: <strong style="color: #10b981;">0% a 29.2%</strong></p>
+    <p class="bullet-item">12 deals con descuento 0% - confirma que NO siempre debe haber descuento</p>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+with col2:
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h3 style="color: #f59e0b; font-family: Crimson Pro, serif;">Que Falta o Preocupa</h3>', unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="highlight-box-warning">
+        <h4 style="color: #f59e0b; margin-top: 0;">A. Endogeneidad (Core)</h4>
+        <p>Los datos reflejan comportamiento <strong>pre-optimizacion</strong>. 
+        Un ML naive imitara patrones, no los corregira.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="highlight-box-danger">
+        <h4 style="color: #ef4444; margin-top: 0;">B. Outcome Ruidoso</h4>
+        <p class="bullet-item">Win/Loss inconsistente entre sistemas</p>
+        <p class="bullet-item">Re-quoted = 15.84% de outcomes</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="highlight-box-warning">
+        <h4 style="color: #f59e0b; margin-top: 0;">C. Quote-to-Invoice Drift</h4>
+        <p class="bullet-item">Drift promedio: <strong>-3.87%</strong></p>
+        <p class="bullet-item">87.78% de deals con |drift| mayor a 1%</p>
+        <p class="bullet-item">El precio facturado siempre menor que quoted</p>
+    </div>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+# Gráfico de inconsistencia
+st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+st.markdown('<h3 style="color: #3b82f6; font-family: Crimson Pro, serif;">Evidencia de Variabilidad Injustificada</h3>', unsafe_allow_html=True)
+st.markdown('</div>', unsafe_allow_html=True)
+
+col3, col4 = st.columns([1, 1])
+
+with col3:
+    st.plotly_chart(inconsistency_figure(), use_container_width=True)
+
+with col4:
+    st.markdown("""
+    <div class="highlight-box">
+        <h4 style="color: #10b981; margin-top: 0;">Implicacion Practica</h4>
+        <p>La alta variabilidad confirma "ruido humano" fuerte en los precios.</p>
+        <p><strong>Para optimizacion, primero hay que:</strong></p>
+        <p class="bullet-item">Reducir variabilidad injustificada</p>
+        <p class="bullet-item">Implementar guardrails + guidance</p>
+        <p class="bullet-item">No modelos sofisticados hasta tener datos limpios</p>
+    </div>
+    """, unsafe_allow_html=True)
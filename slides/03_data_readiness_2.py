@@ -0,0 +1,79 @@
+"""
+Slide 03 / 08 - Data Readiness (Parte 2)
+"""
+
+import pandas as pd
+import streamlit as st
+
+# =============================================================================
+# SLIDE 3: DATA READINESS (PARTE 2)
+# =============================================================================
+
+st.markdown('<p class="slide-number">Slide 03 / 08</p>', unsafe_allow_html=True)
+st.markdown('<h1 class="slide-title">1. Data Readiness Assessment (Parte 2)</h1>', unsafe_allow_html=True)
+st.markdown('<p class="subtitle" style="font-size: 1rem;">Que segmentos tienen data suficiente y donde enfocar</p>', unsafe_allow_html=True)
+
+col1, col2 = st.columns([1, 1])
+
+with col1:
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h3 style="color: #10b981; font-family: Crimson Pro, serif;">Data Suficiente por Segmento</h3>', unsafe_allow_html=True)
+
+    st.markdown('<p class="section-title">Productos (Suficiente)</p>', unsafe_allow_html=True)
+    st.markdown('<p style="color: #cbd5e1;">Cada producto tiene ~188-249 transacciones - suficiente para analisis.</p>', unsafe_allow_html=True)
+
+    st.markdown('<p class="section-title">Producto x Segmento</p>', unsafe_allow_html=True)
+    st.markdown("""
+    <p class="bullet-item">30+ transacciones: <strong style="color: #10b981;">100%</strong> cumplen</p>
+    <p class="bullet-item">50+ transacciones: <strong style="color: #f59e0b;">~68%</strong> cumplen</p>
+    <p class="bullet-item">Zonas "thin" concentradas en segmento <strong>"Other"</strong></p>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="highlight-box">
+        <strong style="color: #10b981;">Implicacion:</strong><br>
+        <p class="bullet-item">Manufacturing y Construction: modelar por segmento con estabilidad</p>
+        <p class="bullet-item">Other: usar pooling/hierarchical, reglas mas agregadas</p>
+    </div>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+with col2:
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h3 style="color: #ef4444; font-family: Crimson Pro, serif;">Segmentos que Mas Erosionan Margen</h3>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    critical_segments = pd.DataFrame({
+        'Segmento + Tier': ['Manufacturing + Platinum', 'Construction + Gold', 'Manufacturing + Gold'],
+        'GM%': ['7.69%', '~11%', '~12%'],
+        'Descuento Medio': ['18.74%', '~15%', '~15%'],
+        'Win Rate': ['48.9%', '~52%', '~55%']
+    })
+
+    st.dataframe(critical_segments, use_container_width=True, hide_index=True)
+
+    st.markdown("""
+    <div class="highlight-box-warning" style="margin-top: 1rem;">
+        <strong style="color: #f59e0b;">Foco de Optimizacion:</strong><br>
+        Estos segmentos tienen descuento "habitual" pero win-rate que no lo justifica.
+        Es donde puedes subir margen hacia 20% sin matar volumen.
+    </div>
+    """, unsafe_allow_html=True)
+
+# Conclusión
+st.markdown("""
+<div class="slide-container">
+    <h3 style="color: #3b82f6; font-family: Crimson Pro, serif;">Conclusion de Data Readiness</h3>
+    <div class="highlight-box" style="border-width: 2px;">
+        <p style="font-size: 1.1rem; margin: 0; color: #cbd5e1;">
+            <strong style="color: #10b981;">SI hay data usable</strong> para empezar con reglas + guidance + modelos simples y explicables.
+        </p>
+        <p style="font-size: 1.1rem; margin: 1rem 0 0; color: #cbd5e1;">
+            <strong style="color: #ef4444;">NO hay condiciones</strong> para "full ML optimization" sin antes resolver:
+        </p>
+        <p class="bullet-item">Outcome noise (Re-quoted, inconsistencia Win/Loss)</p>
+        <p class="bullet-item">Linking de oportunidades (quote_id != opportunity_id)</p>
+        <p class="bullet-item">Control de quote a invoice erosion</p>
+    </div>
+</div>
+""", unsafe_allow_html=True)
@@ -0,0 +1,85 @@
+"""
+Slide 04 / 08 - Enfoque de Optimización (Parte 1)
+"""
+
+import streamlit as st
+
+# =============================================================================
+# SLIDE 4: ENFOQUE DE OPTIMIZACIÓN (PARTE 1)
+# =============================================================================
+
+st.markdown('<p class="slide-number">Slide 04 / 08</p>', unsafe_allow_html=True)
+st.markdown('<h1 class="slide-title">2. Recommended Optimization Approach (Parte 1)</h1>', unsafe_allow_html=True)
+st.markdown('<p class="subtitle" style="font-size: 1rem;">Lo que SI recomendamos implementar</p>', unsafe_allow_html=True)
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h4 style="color: #10b981; margin-bottom: 1rem;">1. Segmented Pricing + Guardrails</h4>', unsafe_allow_html=True)
+    st.markdown('<p style="color: #94a3b8; font-size: 0.9rem;"><strong>Fase 0-1 (Quick Win)</strong></p>', unsafe_allow_html=True)
+    st.markdown("""
+    <p class="bullet-item">Bandas de precio/descuento por segmento + tier + categoria</p>
+    <p class="bullet-item">Piso de margen por categoria</p>
+    <p class="bullet-item">Cap de descuento por tier</p>
+    <p class="bullet-item">Thin data - reglas agregadas (pooling)</p>
+    """, unsafe_allow_html=True)
+    st.markdown("""
+    <div class="highlight-box" style="padding: 1rem;">
+        <strong>Justificacion:</strong> 71.74% de pares tienen rango mayor a 5%<br>
+        Primero estandarizar, luego optimizar
+    </div>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h4 style="color: #f59e0b; margin-bottom: 1rem;">3. Margin-Constrained Price Recommendation</h4>', unsafe_allow_html=True)
+    st.markdown('<p style="color: #94a3b8; font-size: 0.9rem;"><strong>Optimizacion "safe" con restricciones</strong></p>', unsafe_allow_html=True)
+    st.markdown("""
+    <p class="bullet-item">Funcion objetivo: Expected Profit = (p - c) x q x P(win | p)</p>
+    <p class="bullet-item">Grid search sobre descuentos candidatos</p>
+    <p class="bullet-item">Restriccion: margen minimo por categoria/tier</p>
+    <p class="bullet-item">No recomendar descuento si win-prob no mejora</p>
+    """, unsafe_allow_html=True)
+    st.markdown("""
+    <div class="highlight-box-warning" style="padding: 1rem;">
+        <strong>Resultado:</strong> Si a 0-5% ya ganas ~80%,<br>
+        la recomendacion puede ser 0% descuento
+    </div>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+with col2:
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h4 style="color: #3b82f6; margin-bottom: 1rem;">2. Deal Scoring (Win Probability)</h4>', unsafe_allow_html=True)
+    st.markdown('<p style="color: #94a3b8; font-size: 0.9rem;"><strong>Modelo explicable con Won/Lost</strong></p>', unsafe_allow_html=True)
+    st.markdown("""
+    <p class="bullet-item">Features: discount_pct, days_to_close, segment, tier, category, region</p>
+    <p class="bullet-item">Entrenar SOLO con Won/Lost</p>
+    <p class="bullet-item">Excluir Re-quoted (tratarlo como workflow)</p>
+    """, unsafe_allow_html=True)
+    st.markdown("""
+    <div class="highlight-box-blue" style="padding: 1rem;">
+        <strong>Insight clave:</strong><br>
+        0-10% descuento: ~80% win-rate<br>
+        15-20% descuento: 54% win-rate<br>
+        <strong style="color: #ef4444;">Mas descuento NO compra win-rate</strong>
+    </div>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h4 style="color: #8b5cf6; margin-bottom: 1rem;">4. Erosion Control (Quote a Invoice)</h4>', unsafe_allow_html=True)
+    st.markdown('<p style="color: #94a3b8; font-size: 0.9rem;"><strong>Guardrail critico para proteger margen</strong></p>', unsafe_allow_html=True)
+    st.markdown("""
+    <p class="bullet-item">Monitorear diferencia quoted_price a unit_price</p>
+    <p class="bullet-item">Alertas si drift excede umbral</p>
+    <p class="bullet-item">Reason codes para ajustes</p>
+    <p class="bullet-item">Aprobacion si ajuste rompe guardrail</p>
+    """, unsafe_allow_html=True)
+    st.markdown("""
+    <div class="highlight-box-danger" style="padding: 1rem;">
+        <strong>Problema actual:</strong> Drift -3.87%, Sin control no llegas a 20% GM
+    </div>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,111 @@
+"""
+Slide 05 / 08 - Enfoque de Optimización (Parte 2)
+"""
+
+import pandas as pd
+import streamlit as st
+
+# =============================================================================
+# SLIDE 5: ENFOQUE DE OPTIMIZACIÓN (PARTE 2) - RESULTADOS
+# =============================================================================
+
+st.markdown('<p class="slide-number">Slide 05 / 08</p>', unsafe_allow_html=True)
+st.markdown('<h1 class="slide-title">2. Recommended Optimization Approach (Parte 2)</h1>', unsafe_allow_html=True)
+st.markdown('<p class="subtitle" style="font-size: 1rem;">Resultados del Sistema y Lo que NO Recomendamos</p>', unsafe_allow_html=True)
+
+# Métricas
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    st.markdown("""
+    <div class="metric-card metric-card-green">
+        <p class="metric-label">Approval Rate</p>
+        <p class="metric-value">5.0%</p>
+        <p class="metric-subtitle">Solo el 5% mas riesgoso</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+with col2:
+    st.markdown("""
+    <div class="metric-card metric-card-blue">
+        <p class="metric-label">GM Quote</p>
+        <p class="metric-value">23.24%</p>
+        <p class="metric-subtitle">Lo que controla pricing</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+with col3:
+    st.markdown("""
+    <div class="metric-card metric-card-orange">
+        <p class="metric-label">GM Invoice</p>
+        <p class="metric-value">22.17%</p>
+        <p class="metric-subtitle">+2.2pp sobre target 20%</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+with col4:
+    st.markdown("""
+    <div class="metric-card metric-card-purple">
+        <p class="metric-label">Drift After</p>
+        <p class="metric-value">-1.08%</p>
+        <p class="metric-subtitle">Antes: -3.83%</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+col5, col6 = st.columns([1, 1])
+
+with col5:
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h3 style="color: #10b981; font-family: Crimson Pro, serif;">Monte Carlo: Estabilidad Confirmada</h3>', unsafe_allow_html=True)
+    st.markdown('<p style="color: #cbd5e1;"><strong>20 runs x 2000 deals cada uno:</strong></p>', unsafe_allow_html=True)
+
+    monte_carlo_df = pd.DataFrame({
+        'Metrica': ['Approval Rate', 'GM Invoice', 'Drift After'],
+        'Mean': ['4.80%', '22.20%', '-1.07%'],
+        'Std': ['0.51%', '0.08%', '0.02%']
+    })
+    st.dataframe(monte_carlo_df, use_container_width=True, hide_index=True)
+
+    st.markdown("""
+    <div class="highlight-box" style="margin-top: 1rem;">
+        <strong style="color: #10b981;">Sistema production-ready:</strong><br>
+        No depende del mix, no es fragil, escala.
+    </div>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+with col6:
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h3 style="color: #ef4444; font-family: Crimson Pro, serif;">No recomendado (Aún)</h3>', unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="highlight-box-danger">
+        <h4 style="color: #ef4444; margin-top: 0;">1. Elasticity Modeling "Puro" por SKU</h4>
+        <p style="margin-bottom: 0; color: #cbd5e1;">Precios contaminados por decisiones humanas, outcomes con Re-quoted, post-quote erosion.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="highlight-box-danger">
+        <h4 style="color: #ef4444; margin-top: 0;">2. Tratar Re-quoted como Lost</h4>
+        <p style="margin-bottom: 0; color: #cbd5e1;">Es una clase propia (15.84%). Distorsiona la relacion descuento a win.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="highlight-box-danger">
+        <h4 style="color: #ef4444; margin-top: 0;">3. "Siempre Dar Descuento"</h4>
+        <p style="margin-bottom: 0; color: #cbd5e1;">0-10% ya tiene ~80% win-rate. Dar mas descuento ahi es quemar margen.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+# Quote final
+st.markdown("""
+<div class="slide-container" style="text-align: center; border: 2px solid #10b981;">
+    <p style="font-size: 1.1rem; font-style: italic; color: #cbd5e1; margin: 0;">
+        "Reemplazamos el descuento heurístico por una política de precios basada en ranking de riesgo. En lugar de aprobar todo lo que supera un umbral,
+        solo aprobamos el 5% de las operaciones con mayor riesgo. Esto incrementó el margen bruto facturado (invoice GM) de ~18.5% a ~22%, al mismo tiempo que redujo la erosión de precios en ~70%."
+    </p>
+</div>
+""", unsafe_allow_html=True)
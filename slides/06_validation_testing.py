@@ -0,0 +1,131 @@
+"""
+Slide 06 / 08 - Validation & Testing
+"""
+
+import streamlit as st
+
+# =============================================================================
+# SLIDE 6: VALIDATION & TESTING
+# =============================================================================
+
+st.markdown('<p class="slide-number">Slide 06 / 08</p>', unsafe_allow_html=True)
+st.markdown('<h1 class="slide-title">3. Validation & Testing Framework</h1>', unsafe_allow_html=True)
+st.markdown('<p class="subtitle" style="font-size: 1rem;">Como validamos antes de desplegar en toda la empresa</p>', unsafe_allow_html=True)
+
+col1, col2 = st.columns([1, 1])
+
+with col1:
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h3 style="color: #3b82f6; font-family: Crimson Pro, serif;">Fase 1: Validacion Offline</h3>', unsafe_allow_html=True)
+
+    st.markdown('<p class="section-title">Backtesting: "Qué habría pasado si...?"</p>', unsafe_allow_html=True)
+    st.markdown('<p style="color: #cbd5e1;">Simular el nuevo sistema usando datos historicos, sin afectar operaciones.</p>', unsafe_allow_html=True)
+    st.markdown("""
+    <p class="bullet-item">Tomar deals historicos</p>
+    <p class="bullet-item">Aplicar precio recomendado por el sistema</p>
+    <p class="bullet-item">Simular erosion real</p>
+    <p class="bullet-item">Medir margen resultante</p>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="highlight-box" style="margin-top: 1rem;">
+        <strong>Resultados del Backtest:</strong><br>
+        Margen sube de ~18.5% a ~22%<br>
+        Solo 5/100 deals requieren aprobacion
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown('<p class="section-title">Monte Carlo: "Es suerte o es estable?"</p>', unsafe_allow_html=True)
+    st.markdown('<p style="color: #cbd5e1;">Miles de combinaciones aleatorias para validar que no depende del mix especifico.</p>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+with col2:
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h3 style="color: #f59e0b; font-family: Crimson Pro, serif;">Fase 2: Champion / Challenger</h3>', unsafe_allow_html=True)
+
+    st.markdown('<p class="section-title">Qué es?</p>', unsafe_allow_html=True)
+    st.markdown("""
+    <p style="color: #cbd5e1;"><strong style="color: #10b981;">Champion</strong> = proceso actual de precios<br>
+    <strong style="color: #3b82f6;">Challenger</strong> = nuevo sistema</p>
+    <p style="color: #cbd5e1;">Ambos conviven al mismo tiempo, en una parte del negocio, durante tiempo limitado.</p>
+    """, unsafe_allow_html=True)
+
+    st.markdown('<p class="section-title">Implementación Práctica</p>', unsafe_allow_html=True)
+    st.markdown("""
+    <p class="bullet-item">De cada 10 cotizaciones: 8 Champion, 2 Challenger</p>
+    <p class="bullet-item">Asignacion aleatoria, balanceando segmentos</p>
+    <p class="bullet-item">Comparacion manzanas con manzanas</p>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="highlight-box-warning" style="margin-top: 1rem;">
+        <strong>NO es un "big bang".</strong><br>
+        Probamos en pequeno, medimos con dinero real.
+    </div>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+# Métricas a medir
+st.markdown('<h3 style="color: #10b981; font-family: Crimson Pro, serif; margin-top: 1rem;">Metricas Durante el Test</h3>', unsafe_allow_html=True)
+
+col3, col4, col5 = st.columns(3)
+
+with col3:
+    st.markdown("""
+    <div class="highlight-box-blue" style="height: 180px;">
+        <h4 style="color: #3b82f6; margin-bottom: 1rem;">Metricas de Dinero</h4>
+        <p class="bullet-item">Margen real facturado (invoice GM)</p>
+        <p class="bullet-item">Erosion quote a invoice</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+with col4:
+    st.markdown("""
+    <div class="highlight-box" style="height: 180px;">
+        <h4 style="color: #10b981; margin-bottom: 1rem;">Metricas Comerciales</h4>
+        <p class="bullet-item">Win rate</p>
+        <p class="bullet-item">Tiempo de cierre</p>
+        <p class="bullet-item">% deals sin descuento</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+with col5:
+    st.markdown("""
+    <div class="highlight-box-warning" style="height: 180px;">
+        <h4 style="color: #f59e0b; margin-bottom: 1rem;">Metricas Operativas</h4>
+        <p class="bullet-item">% deals que requieren aprobacion</p>
+        <p class="bullet-item">Tiempo de aprobacion</p>
+        <p class="bullet-item">Excepciones solicitadas</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+# Criterios
+col6, col7 = st.columns([1, 1])
+
+with col6:
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h4 style="color: #10b981;">Criterios de Exito (Pre-definidos)</h4>', unsafe_allow_html=True)
+    st.markdown("""
+    <p class="bullet-item">Margen sube al menos <strong style="color: #10b981;">1 punto porcentual</strong></p>
+    <p class="bullet-item">Erosion baja al menos <strong style="color: #10b981;">50%</strong></p>
+    <p class="bullet-item">Win rate no cae mas de <strong style="color: #f59e0b;">1-2 puntos</strong></p>
+    <p class="bullet-item">Aprobaciones cerca del <strong style="color: #3b82f6;">5%</strong></p>
+    """, unsafe_allow_html=True)
+    st.markdown('<p style="margin-top: 1rem; color: #10b981;"><strong>Si se cumple: nuevo sistema reemplaza al actual. Sin discusion subjetiva.</strong></p>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+with col7:
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h4 style="color: #ef4444;">Guardrails Activos</h4>', unsafe_allow_html=True)
+    st.markdown("""
+    <p class="bullet-item">Sistema no puede recomendar margen negativo</p>
+    <p class="bullet-item">Descuentos extremos bloqueados</p>
+    <p class="bullet-item">5% mas riesgoso pasa por aprobacion humana</p>
+    """, unsafe_allow_html=True)
+    st.markdown("""
+    <div class="highlight-box-danger" style="margin-top: 1rem;">
+        <strong>Kill Switch:</strong> Si metrica clave sale de rango, 
+        se apaga challenger inmediatamente.
+    </div>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,103 @@
+"""
+Slide 07 / 08 - Riesgos y Mitigación
+"""
+
+import streamlit as st
+
+# =============================================================================
+# SLIDE 7: RIESGOS Y MITIGACIÓN
+# =============================================================================
+
+st.markdown('<p class="slide-number">Slide 07 / 08</p>', unsafe_allow_html=True)
+st.markdown('<h1 class="slide-title">4. Key Risks & Mitigation</h1>', unsafe_allow_html=True)
+st.markdown('<p class="subtitle" style="font-size: 1rem;">Cuales son los riesgos principales? Como abordamos la resistencia de ventas?</p>', unsafe_allow_html=True)
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h4 style="color: #ef4444; margin-bottom: 1rem;">Riesgo #1: "El sistema no entiende el contexto humano"</h4>', unsafe_allow_html=True)
+    st.markdown('<p style="color: #94a3b8; font-size: 0.9rem;"><strong>Lo que Carlos (VP Sales) teme:</strong> Que el algoritmo reemplace su criterio.</p>', unsafe_allow_html=True)
+    st.markdown("""
+    <div class="highlight-box" style="padding: 1rem;">
+        <strong style="color: #10b981;">Mitigacion:</strong><br>
+        <p class="bullet-item">El sistema NO bloquea decisiones humanas</p>
+        <p class="bullet-item">Solo envia a aprobacion el 5% mas riesgoso</p>
+        <p class="bullet-item">95% de deals: vendedor cotiza rapido</p>
+        <p class="bullet-item">"Es un copiloto, no piloto automatico"</p>
+    </div>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h4 style="color: #ef4444; margin-bottom: 1rem;">Riesgo #3: "Protege margen en deals que ya ibamos a perder"</h4>', unsafe_allow_html=True)
+    st.markdown('<p style="color: #94a3b8; font-size: 0.9rem;"><strong>Objecion clasica de ventas.</strong></p>', unsafe_allow_html=True)
+    st.markdown("""
+    <div class="highlight-box" style="padding: 1rem;">
+        <strong style="color: #10b981;">Mitigacion (con datos):</strong><br>
+        <p style="color: #cbd5e1; margin: 0.5rem 0;">0-10% descuento: <strong>~80% win-rate</strong></p>
+        <p style="color: #cbd5e1; margin: 0.5rem 0;">15-20% descuento: 54% win-rate</p>
+        <p style="color: #cbd5e1; margin: 0.5rem 0;">20-25% descuento: 35% win-rate</p>
+        <p style="margin-top: 0.5rem; color: #f59e0b;">"No te quito armas. Te quito balas desperdiciadas."</p>
+    </div>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+with col2:
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h4 style="color: #ef4444; margin-bottom: 1rem;">Riesgo #2: "Esto nos va a volver mas lentos"</h4>', unsafe_allow_html=True)
+    st.markdown('<p style="color: #94a3b8; font-size: 0.9rem;"><strong>Trauma previo:</strong> PriceFx aumento tiempo de cotizacion.</p>', unsafe_allow_html=True)
+    st.markdown("""
+    <div class="highlight-box" style="padding: 1rem;">
+        <strong style="color: #10b981;">Mitigacion:</strong><br>
+        <p class="bullet-item">Aprobaciones historicas: difusas, frecuentes</p>
+        <p class="bullet-item">Nuevo sistema: <strong>5% fijo</strong>, predecible</p>
+        <p class="bullet-item">"Hoy no sabes cuantos van a aprobacion. Con esto lo sabes: 5 de cada 100."</p>
+    </div>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h4 style="color: #ef4444; margin-bottom: 1rem;">Riesgo #4: "La data esta sucia"</h4>', unsafe_allow_html=True)
+    st.markdown('<p style="color: #94a3b8; font-size: 0.9rem;"><strong>Preocupacion legitima de Maria (Pricing Manager).</strong></p>', unsafe_allow_html=True)
+    st.markdown("""
+    <div class="highlight-box" style="padding: 1rem;">
+        <strong style="color: #10b981;">Mitigacion por diseno:</strong><br>
+        <p class="bullet-item">NO elasticidad por SKU (requiere data limpia)</p>
+        <p class="bullet-item">Pooling por segmento/tier/categoria</p>
+        <p class="bullet-item">Re-quotes excluidos del win-model</p>
+        <p class="bullet-item">Thin data: reglas agregadas</p>
+        <p style="margin-top: 0.5rem; color: #10b981;">"Este sistema asume data real, no perfecta"</p>
+    </div>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+# Incentivo y conclusión
+col3, col4 = st.columns([1, 1])
+
+with col3:
+    st.markdown("""
+    <div class="slide-container" style="border: 2px solid #10b981;">
+        <h4 style="color: #10b981;">Convertir Resistencia en Alianza</h4>
+        <p style="color: #cbd5e1;"><strong>Palanca final: Comisiones</strong></p>
+        <p class="bullet-item">Menos descuentos innecesarios</p>
+        <p class="bullet-item">Mas margen por deal</p>
+        <p class="bullet-item">Mejores comisiones para el equipo</p>
+        <div class="highlight-box" style="margin-top: 1rem;">
+            <strong>"Si el equipo gana el mismo numero de deals con menos descuento, todos ganan mas."</strong>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+with col4:
+    st.markdown("""
+    <div class="slide-container" style="border: 2px solid #3b82f6;">
+        <h4 style="color: #3b82f6;">Mensaje para Stakeholders</h4>
+        <p style="font-style: italic; font-size: 0.9rem; color: #cbd5e1;">
+            “Los principales riesgos son la resistencia del equipo comercial, las preocupaciones sobre la calidad de los datos y la fricción operativa. 
+            Estos riesgos se mitigan desde el diseño: el sistema no reemplaza el criterio comercial, limita las aprobaciones únicamente al 5% de las operaciones más riesgosas y es robusto frente a datos imperfectos.”
+        </p>
+        <p style="font-style: italic; font-size: 0.9rem; margin-top: 1rem; color: #cbd5e1;">
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
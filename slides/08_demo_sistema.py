@@ -0,0 +1,194 @@
+"""
+Slide 08 / 08 - Demo del Sistema
+"""
+
+import streamlit as st
+
+from charts import elasticity_figure
+from pricing import CUSTOMERS, PRODUCTS, RULES, calculate_price_guidance, evaluate_quote
+from search_index import SearchIndex
+
+# =============================================================================
+# COMPONENTES DE LA DEMO
+# =============================================================================
+
+# Opciones enviadas al navegador por selector
+SEARCH_RESULTS = 20
+
+
+@st.cache_resource(show_spinner=False)
+def search_index(kind):
+    return SearchIndex.from_catalog(CUSTOMERS if kind == 'customer' else PRODUCTS)
+
+
+def search_select(label, index, placeholder):
+    # El selectbox solo recibe los top-k de la busqueda, no el catalogo completo
+    query = st.text_input(f"Buscar {label.lower()}", placeholder=placeholder)
+    options = index.search(query, k=SEARCH_RESULTS)
+    if not options:
+        st.caption("Sin coincidencias; se muestran los primeros registros")
+        options = index.search('', k=SEARCH_RESULTS)
+    return st.selectbox(label, options=options, format_func=index.label)
+
+
+@st.fragment
+def quote_evaluator(guidance):
+    # Fragmento: el slider solo re-ejecuta este panel, no la slide completa
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h3 style="color: #f59e0b; font-family: Crimson Pro, serif; font-size: 1.25rem;">Evaluar Cotizacion</h3>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    eval_cols = st.columns([2, 1])
+
+    with eval_cols[0]:
+        quoted_price = st.slider(
+            "Precio Cotizado",
+            min_value=int(guidance['cost'] * 0.9),
+            max_value=int(guidance['list_price']),
+            value=int(guidance['target_price']),
+            step=10
+        )
+
+    evaluation = evaluate_quote(quoted_price, guidance)
+
+    with eval_cols[1]:
+        st.markdown(f"""
+        <div style="background: {evaluation['color']}20; border: 2px solid {evaluation['color']}; 
+                    border-radius: 0.75rem; padding: 1.5rem; text-align: center;">
+            <p style="font-size: 2rem; font-weight: bold; color: {evaluation['color']}; margin: 0;">
+                {evaluation['status']}
+            </p>
+            <p style="font-size: 0.875rem; color: #cbd5e1; margin: 0.5rem 0 0;">
+                Descuento: {evaluation['discount']:.1f}% | Margen: {evaluation['margin']:.1f}%
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown(f"""
+    <div class="highlight-box" style="margin-top: 1rem;">
+        <strong style="color: {evaluation['color']};">{evaluation['message']}</strong>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+# =============================================================================
+# SLIDE 8: DEMO DEL SISTEMA
+# =============================================================================
+
+st.markdown('<p class="slide-number">Slide 08 / 08</p>', unsafe_allow_html=True)
+st.markdown('<h1 class="slide-title">Demo: Sistema de Cotizacion Inteligente</h1>', unsafe_allow_html=True)
+
+col1, col2 = st.columns([1, 2])
+
+with col1:
+    st.markdown('<div class="slide-container">', unsafe_allow_html=True)
+    st.markdown('<h3 style="color: #10b981; font-family: Crimson Pro, serif; font-size: 1.25rem;">Datos de la Cotizacion</h3>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    customer_id = search_select("Cliente", search_index('customer'), "Codigo o nombre (p.ej. Andinas)")
+
+    customer = CUSTOMERS[customer_id]
+    st.markdown(f"""
+    <div style="background: rgba(30, 41, 59, 0.6); padding: 1rem; border-radius: 0.5rem; margin-bottom: 1rem;">
+        <p style="margin: 0; font-size: 0.875rem; color: #94a3b8;">
+            <strong>Segmento:</strong> {customer['segment']}<br>
+            <strong>Tier:</strong> {customer['tier']}<br>
+            <strong>Region:</strong> {customer['region']}
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    product_id = search_select("Producto", search_index('product'), "Codigo o nombre (p.ej. Lámina, Tubo)")
+
+    product = PRODUCTS[product_id]
+    st.markdown(f"""
+    <div style="background: rgba(30, 41, 59, 0.6); padding: 1rem; border-radius: 0.5rem; margin-bottom: 1rem;">
+        <p style="margin: 0; font-size: 0.875rem; color: #94a3b8;">
+            <strong>Categoria:</strong> {product['category']}<br>
+            <strong>Precio Lista:</strong> ${product['list_price']:,.2f}<br>
+            <strong>Costo:</strong> ${product['cost']:,.2f}
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    quantity = st.number_input("Cantidad", min_value=1, value=100, step=10)
+
+    if st.button("Calcular Guia de Precios", type="primary", use_container_width=True):
+        st.session_state.quote = (customer_id, product_id, quantity)
+        st.session_state.guidance = calculate_price_guidance(customer_id, product_id, quantity)
+
+with col2:
+    if 'guidance' in st.session_state:
+        rules = RULES.current()
+        if st.session_state.guidance['rules_version'] != rules.version:
+            # Reglas recargadas: la guia se recalcula con el snapshot vigente
+            st.session_state.guidance = calculate_price_guidance(*st.session_state.quote, rules)
+        guidance = st.session_state.guidance
+
+        metric_cols = st.columns(4)
+
+        with metric_cols[0]:
+            st.markdown(f"""
+            <div class="metric-card metric-card-green">
+                <p class="metric-label">Precio Objetivo</p>
+                <p class="metric-value">${guidance['target_price']:,.0f}</p>
+                <p class="metric-subtitle">Descuento: {guidance['target_discount']:.1f}%</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with metric_cols[1]:
+            st.markdown(f"""
+            <div class="metric-card metric-card-blue">
+                <p class="metric-label">Precio Techo</p>
+                <p class="metric-value">${guidance['ceiling_price']:,.0f}</p>
+                <p class="metric-subtitle">Descuento: {guidance['ceiling_discount']:.1f}%</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with metric_cols[2]:
+            st.markdown(f"""
+            <div class="metric-card metric-card-orange">
+                <p class="metric-label">Margen Objetivo</p>
+                <p class="metric-value">{guidance['target_margin_pct']:.1f}%</p>
+                <p class="metric-subtitle">${guidance['target_margin_total']:,.0f} total</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with metric_cols[3]:
+            st.markdown(f"""
+            <div class="metric-card metric-card-purple">
+                <p class="metric-label">Margen Minimo</p>
+                <p class="metric-value">{guidance['margin_floor']:.1f}%</p>
+                <p class="metric-subtitle">Piso requerido</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # Gráfico
+        st.plotly_chart(elasticity_figure(*st.session_state.quote, rules), use_container_width=True)
+
+        # Evaluador
+        quote_evaluator(guidance)
+
+        # Explicación
+        st.markdown("""
+        <div class="slide-container" style="margin-top: 1rem;">
+            <h4 style="color: #3b82f6;">Como funciona este sistema?</h4>
+            <p class="bullet-item"><strong>Precio Objetivo:</strong> Descuento base por tier + ajustes por categoria, segmento y region</p>
+            <p class="bullet-item"><strong>Precio Techo:</strong> Maximo antes de requerir aprobacion de gerente</p>
+            <p class="bullet-item"><strong>Margen Minimo:</strong> Piso absoluto que protege rentabilidad</p>
+            <p class="bullet-item"><strong>Curva Win-Prob:</strong> Basada en datos historicos, muestra que mas descuento NO siempre mejora win-rate</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    else:
+        st.markdown("""
+        <div class="slide-container" style="text-align: center; padding: 4rem;">
+            <p style="font-size: 1.25rem; color: #94a3b8;">
+                Seleccione un cliente, producto y cantidad, luego haga clic en 
+                <strong style="color: #10b981;">"Calcular Guia de Precios"</strong>
+            </p>
+            <p style="font-size: 1rem; color: #64748b; margin-top: 1rem;">
+                Este demo muestra como el sistema de guardrails recomienda precios y evalua cotizaciones en tiempo real.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,184 @@
+"""
+ACERO INDUSTRIAL - Modelo de Probabilidad de Ganar
+Regresion logistica (Newton / IRLS, solo NumPy) entrenada SOLO con deals
+Won/Lost (Re-quoted se excluye: es workflow, no outcome).
+
+Features: discount_pct (lineal por tramos con knots en los breakpoints de la
+curva actual), days_to_close, segment, tier, category y region (one-hot,
+primer nivel como base).
+
+El modelo ajustado se exporta como WinCurveTable: un logit base por celda
+segmento x tier x categoria x region mas los coeficientes de descuento, de
+modo que el simulador evalua P(win) con un lookup y un sigmoid.
+
+Uso:
+    python win_model.py transacciones.csv tabla_win.npz
+"""
+
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+from pricing import WIN_CURVE_BREAKS
+
+CATEGORICAL_FEATURES = ('segment', 'tier', 'category', 'region')
+
+
+def _sigmoid(x):
+    return 0.5 * (1 + np.tanh(0.5 * x))
+
+
+def discount_basis(discount, knots):
+    discount = np.asarray(discount, dtype=float)[..., None]
+    return np.concatenate([discount, np.maximum(discount - np.asarray(knots), 0)], axis=-1)
+
+
+class WinCurveTable:
+    # logit(d) = cell_logit[celda] + discount_basis(d) @ discount_coef
+    # Cada dimension lleva un slot extra al final (efecto 0) para niveles no
+    # vistos en el entrenamiento.
+
+    def __init__(self, levels, cell_logit, discount_coef, knots):
+        self.levels = {k: tuple(v) for k, v in levels.items()}
+        self.cell_logit = np.asarray(cell_logit, dtype=float)
+        self.discount_coef = np.asarray(discount_coef, dtype=float)
+        self.knots = np.asarray(knots, dtype=float)
+
+    def encode(self, segment, tier, category, region):
+        codes = []
+        for name, values in zip(CATEGORICAL_FEATURES, (segment, tier, category, region)):
+            labels = self.levels[name]
+            code = pd.Index(labels).get_indexer(np.atleast_1d(np.asarray(values, dtype=object)))
+            code[code < 0] = len(labels)
+            codes.append(code)
+        return np.ravel_multi_index(codes, self.cell_logit.shape)
+
+    def evaluate(self, cells, discounts):
+        """P(win) en 0-1 con forma (celdas x descuentos)."""
+        base = self.cell_logit.ravel()[np.asarray(cells)][:, None]
+        return _sigmoid(base + discount_basis(discounts, self.knots) @ self.discount_coef)
+
+    def save(self, path):
+        np.savez(
+            path,
+            cell_logit=self.cell_logit,
+            discount_coef=self.discount_coef,
+            knots=self.knots,
+            **{f'levels_{k}': np.array(v, dtype=str) for k, v in self.levels.items()}
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            levels = {k: data[f'levels_{k}'].tolist() for k in CATEGORICAL_FEATURES}
+            return cls(levels, data['cell_logit'], data['discount_coef'], data['knots'])
+
+
+class WinModel:
+
+    def __init__(self, levels, coef, feature_names, knots, days_ref):
+        self.levels = levels
+        self.coef = coef
+        self.feature_names = feature_names
+        self.knots = knots
+        self.days_ref = days_ref
+
+    def design_matrix(self, frame):
+        return _design_matrix(frame, self.levels, self.knots)
+
+    def predict(self, frame):
+        return _sigmoid(self.design_matrix(frame) @ self.coef)
+
+    def lookup_table(self, days_to_close=None):
+        """Exporta a WinCurveTable fijando days_to_close (default: media de entrenamiento)."""
+        days = self.days_ref if days_to_close is None else days_to_close
+        n_discount = 1 + len(self.knots)
+        intercept = self.coef[0] + self.coef[1 + n_discount] * days
+
+        cell_logit = np.full([len(self.levels[k]) + 1 for k in CATEGORICAL_FEATURES], intercept)
+        i = 2 + n_discount
+        for axis, name in enumerate(CATEGORICAL_FEATURES):
+            # Nivel base y slot desconocido quedan con efecto 0
+            effects = np.zeros(len(self.levels[name]) + 1)
+            effects[1:-1] = self.coef[i:i + len(self.levels[name]) - 1]
+            i += len(self.levels[name]) - 1
+            shape = [1] * len(CATEGORICAL_FEATURES)
+            shape[axis] = -1
+            cell_logit = cell_logit + effects.reshape(shape)
+
+        return WinCurveTable(self.levels, cell_logit, self.coef[1:1 + n_discount], self.knots)
+
+
+def _design_matrix(frame, levels, knots):
+    n = len(frame)
+    blocks = [
+        np.ones((n, 1)),
+        discount_basis(frame['discount_pct'].to_numpy(dtype=float), knots),
+        frame['days_to_close'].to_numpy(dtype=float)[:, None]
+    ]
+    for name in CATEGORICAL_FEATURES:
+        codes = pd.Index(levels[name]).get_indexer(frame[name].to_numpy(dtype=object))
+        onehot = np.zeros((n, len(levels[name]) - 1))
+        rows = np.flatnonzero(codes > 0)
+        onehot[rows, codes[rows] - 1] = 1
+        blocks.append(onehot)
+    return np.hstack(blocks)
+
+
+def fit_win_model(transactions, knots=WIN_CURVE_BREAKS, ridge=1e-6, max_iter=30, tol=1e-8):
+    """Ajusta la logistica por Newton-Raphson (IRLS) sobre deals Won/Lost."""
+    data = transactions[transactions['outcome'].isin(['Won', 'Lost'])]
+    y = (data['outcome'] == 'Won').to_numpy(dtype=float)
+
+    levels = {name: tuple(sorted(data[name].unique())) for name in CATEGORICAL_FEATURES}
+    X = _design_matrix(data, levels, knots)
+
+    feature_names = (
+        ['intercept', 'discount_pct'] + [f'discount_pct>{k:g}' for k in knots] + ['days_to_close']
+        + [f'{name}={level}' for name in CATEGORICAL_FEATURES for level in levels[name][1:]]
+    )
+
+    coef = np.zeros(X.shape[1])
+    penalty = ridge * np.eye(X.shape[1])
+    penalty[0, 0] = 0
+    for _ in range(max_iter):
+        p = _sigmoid(X @ coef)
+        w = p * (1 - p)
+        gradient = X.T @ (y - p) - penalty @ coef
+        hessian = X.T @ (X * w[:, None]) + penalty
+        step = np.linalg.solve(hessian, gradient)
+        coef += step
+        if np.max(np.abs(step)) < tol:
+            break
+
+    return WinModel(levels, coef, feature_names, np.asarray(knots, dtype=float), float(data['days_to_close'].mean()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ajusta el modelo de win-probability y exporta la tabla de lookup.")
+    parser.add_argument('input', help="CSV de transacciones historicas")
+    parser.add_argument('output', help="Archivo .npz de la tabla")
+    args = parser.parse_args(argv)
+
+    columns = ['outcome', 'discount_pct', 'days_to_close', *CATEGORICAL_FEATURES]
+    try:
+        transactions = pd.read_csv(args.input, usecols=lambda c: c in columns)
+        missing = set(columns) - set(transactions.columns)
+        if missing:
+            raise ValueError(f"Faltan columnas en {args.input}: {', '.join(sorted(missing))}")
+        if transactions.empty:
+            raise ValueError(f"Sin transacciones en {args.input}")
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"error: {exc}\n")
+
+    model = fit_win_model(transactions)
+    model.lookup_table().save(args.output)
+    for name, value in zip(model.feature_names, model.coef):
+        print(f"{name:>28} {value:+.4f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())